@@ -1,5 +1,7 @@
 """Client API for Nexus."""
 
+import atexit
+import threading
 import typing
 import warnings
 from importlib.metadata import version
@@ -33,6 +35,9 @@ class AuthHandler(httpx.Auth):
 
     def __init__(self) -> None:
         self.cookies = httpx.Cookies()
+        # Serialises token refreshes so that concurrent requests that all
+        # receive a 401 trigger a single call to the refresh endpoint.
+        self._refresh_lock = threading.Lock()
         self.reload_tokens()
 
         super().__init__()
@@ -51,6 +56,7 @@ class AuthHandler(httpx.Auth):
     def auth_flow(
         self, request: httpx.Request
     ) -> typing.Generator[httpx.Request, httpx.Response, None]:
+        sent_id_token = self.cookies.get("myqos_id")
         self.cookies.set_cookie_header(request)
 
         response = yield request
@@ -58,37 +64,49 @@ class AuthHandler(httpx.Auth):
         _check_sunset_header(request, response)
 
         if response.status_code == 401:
-            if self.cookies.get("myqos_oat") is None:
-                try:
-                    token = read_token(
-                        "refresh_token",
-                    )
-                    self.cookies.set("myqos_oat", token, domain=CONFIG.domain)
-                except FileNotFoundError as exc:
-                    raise AuthenticationError(
-                        "Not authenticated. Please run `qnx login` in your terminal."
-                    ) from exc
-
-            auth_response = yield self.build_refresh_request()
-            if auth_response.status_code == 401:
-                raise AuthenticationError(
-                    "Not authenticated. Please run `qnx login` in your terminal."
-                )
+            with self._refresh_lock:
+                # Only refresh if no other request has already done so
+                # since this one was sent, otherwise retry with the new token.
+                if self.cookies.get("myqos_id") == sent_id_token:
+                    auth_response = yield from self._refresh_flow()
+                    _check_version_headers(auth_response)
 
-            auth_response.raise_for_status()
-            self.cookies.extract_cookies(auth_response)
-
-            write_token(
-                "access_token",
-                self.cookies.get("myqos_id", domain=CONFIG.domain) or "",
-            )
             if request.headers.get("cookie"):
                 request.headers.pop("cookie")
             self.cookies.set_cookie_header(request)
 
-            _check_version_headers(auth_response)
             yield request
 
+    def _refresh_flow(
+        self,
+    ) -> typing.Generator[httpx.Request, httpx.Response, httpx.Response]:
+        """Refresh the id token, storing the new token on success."""
+        if self.cookies.get("myqos_oat") is None:
+            try:
+                token = read_token(
+                    "refresh_token",
+                )
+                self.cookies.set("myqos_oat", token, domain=CONFIG.domain)
+            except FileNotFoundError as exc:
+                raise AuthenticationError(
+                    "Not authenticated. Please run `qnx login` in your terminal."
+                ) from exc
+
+        auth_response = yield self.build_refresh_request()
+        if auth_response.status_code == 401:
+            raise AuthenticationError(
+                "Not authenticated. Please run `qnx login` in your terminal."
+            )
+
+        auth_response.raise_for_status()
+        self.cookies.extract_cookies(auth_response)
+
+        write_token(
+            "access_token",
+            self.cookies.get("myqos_id", domain=CONFIG.domain) or "",
+        )
+        return auth_response
+
     def build_refresh_request(self) -> httpx.Request:
         """Build the request for refreshing the id token."""
         self.cookies.delete("myqos_id")  # We need to delete any existing id token first
@@ -100,6 +118,14 @@ class AuthHandler(httpx.Auth):
         )
 
 
+# Idle connections are kept alive between calls so that bursts of requests
+# (e.g. paginated listings or fetching job results) reuse the same TLS session.
+CONNECTION_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=30.0,
+)
+
 _nexus_client: httpx.Client | None = None
 
 
@@ -111,6 +137,8 @@ def get_nexus_client(reload: bool = False) -> httpx.Client:
         httpx.Client: The nexus client.
     """
     global _nexus_client
+    if reload:
+        _clear_account_caches()
     if _nexus_client is None or reload:
         _auth_handler = AuthHandler()
         _auth_handler.reload_tokens()
@@ -120,10 +148,26 @@ def get_nexus_client(reload: bool = False) -> httpx.Client:
             auth=_auth_handler,
             timeout=None,
             verify=CONFIG.httpx_verify,
+            limits=CONNECTION_LIMITS,
         )
     return _nexus_client
 
 
+def _clear_account_caches() -> None:
+    """Clear data cached from Nexus that depends on the logged in account."""
+    from qnexus.client import circuits, devices
+
+    circuits.invalidate_cache()
+    devices.invalidate_cache()
+
+
+@atexit.register
+def _close_nexus_client() -> None:
+    """Close the pooled connections of the nexus client on interpreter exit."""
+    if _nexus_client is not None:
+        _nexus_client.close()
+
+
 def _check_sunset_header(request: httpx.Request, response: httpx.Response) -> None:
     sunset_header = response.headers.get("sunset")
     path = urlparse(str(request.url)).path
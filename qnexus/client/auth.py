@@ -9,10 +9,7 @@ from http import HTTPStatus
 
 import httpx
 import jwt
-from colorama import Fore
 from pydantic import EmailStr
-from rich.console import Console
-from rich.panel import Panel
 
 import qnexus.exceptions as qnx_exc
 from qnexus.client import (
@@ -24,8 +21,6 @@ from qnexus.client import (
 from qnexus.client.utils import consolidate_error, read_token, remove_token, write_token
 from qnexus.config import CONFIG
 
-console = Console()
-
 
 def is_logged_in() -> bool:
     """Check if the user is already logged in by verifying tokens and
@@ -82,6 +77,11 @@ def login(force: bool = False) -> None:
 
     (if web browser can't be launched, displays the link)
     """
+    # Only needed for interactive login, so kept out of the import of qnexus.
+    from colorama import Fore
+    from rich.console import Console
+    from rich.panel import Panel
+
     if not force and is_logged_in():
         print("Already logged in. Tokens are valid.")
         return
@@ -92,11 +92,12 @@ def login(force: bool = False) -> None:
         data={"client_id": "scales", "scope": "myqos"},
     )
 
-    user_code = res.json()["user_code"]
-    device_code = res.json()["device_code"]
-    verification_uri_complete = res.json()["verification_uri_complete"]
-    expires_in = res.json()["expires_in"]
-    poll_interval = res.json()["interval"]
+    res_json = res.json()
+    user_code = res_json["user_code"]
+    device_code = res_json["device_code"]
+    verification_uri_complete = res_json["verification_uri_complete"]
+    expires_in = res_json["expires_in"]
+    poll_interval = res_json["interval"]
 
     webbrowser.open(verification_uri_complete, new=2)
 
@@ -108,7 +109,7 @@ def login(force: bool = False) -> None:
 
     print("🌐 Browser log in initiated.")
 
-    console.print(
+    Console().print(
         Panel(
             f"""
         Confirm that the browser shows the following code and click 'allow device':
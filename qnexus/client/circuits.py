@@ -1,6 +1,7 @@
 """Client API for circuits in Nexus."""
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Union, cast
 from uuid import UUID
 from warnings import warn
@@ -12,7 +13,11 @@ from quantinuum_schemas.models.backend_config import BackendConfig, QuantinuumCo
 import qnexus.exceptions as qnx_exc
 from qnexus.client import get_nexus_client
 from qnexus.client.nexus_iterator import NexusIterator
-from qnexus.client.utils import handle_fetch_errors
+from qnexus.client.utils import (
+    handle_fetch_errors,
+    index_included,
+    project_ref_resolver,
+)
 from qnexus.context import (
     get_active_project,
     merge_project_from_context,
@@ -103,17 +108,10 @@ def _to_circuitref(page_json: dict[str, Any]) -> DataframableList[CircuitRef]:
 
     circuit_refs: DataframableList[CircuitRef] = DataframableList([])
 
+    project_of = project_ref_resolver(index_included(page_json["included"]))
+
     for circuit_data in page_json["data"]:
-        project_id = circuit_data["relationships"]["project"]["data"]["id"]
-        project_details = next(
-            proj for proj in page_json["included"] if proj["id"] == project_id
-        )
-        project = ProjectRef(
-            id=project_id,
-            annotations=Annotations.from_dict(project_details["attributes"]),
-            contents_modified=project_details["attributes"]["contents_modified"],
-            archived=project_details["attributes"]["archived"],
-        )
+        project = project_of(circuit_data)
 
         circuit_refs.append(
             CircuitRef(
@@ -225,13 +223,11 @@ def update(
     properties: PropertiesDict | None = None,
 ) -> CircuitRef:
     """Update the annotations on a CircuitRef."""
-    ref_annotations = ref.annotations.model_dump()
     annotations = Annotations(
         name=name,
         description=description,
         properties=properties if properties else PropertiesDict(),
     ).model_dump(exclude_none=True)
-    ref_annotations.update(annotations)
 
     req_dict = {
         "data": {
@@ -247,6 +243,8 @@ def update(
         raise qnx_exc.ResourceUpdateFailed(
             message=res.text, status_code=res.status_code
         )
+    # Cached refs would otherwise keep the old annotations.
+    _fetch_by_id_cached.cache_clear()
 
     res_dict = res.json()["data"]
 
@@ -290,13 +288,41 @@ def _fetch_by_id(
     )
 
 
+@lru_cache(maxsize=512)
+def _fetch_by_id_cached(circuit_id: str, scope: ScopeFilterEnum) -> CircuitRef:
+    """Fetch a CircuitRef, reusing refs fetched earlier in the session.
+
+    Only for collecting compilation passes and execution results, which look
+    up the same circuits repeatedly. Cleared when a circuit is updated and
+    when the nexus client is reloaded.
+    """
+    return _fetch_by_id(circuit_id, scope=scope)
+
+
+def invalidate_cache() -> None:
+    """Clear the cached circuit refs and circuit contents."""
+    _fetch_by_id_cached.cache_clear()
+    _fetch_circuit_cached.cache_clear()
+
+
 @merge_scope_from_context
 def _fetch_circuit(
     handle: CircuitRef, scope: ScopeFilterEnum = ScopeFilterEnum.USER
 ) -> Circuit:
-    """Utility method for fetching a pytket circuit from a CircuitRef."""
+    """Utility method for fetching a pytket circuit from a CircuitRef.
+
+    Circuit contents never change once uploaded, so they are cached per
+    circuit and scope. The returned circuit is shared, so callers must copy it
+    before handing it out.
+    """
+    return _fetch_circuit_cached(str(handle.id), scope)
+
+
+@lru_cache(maxsize=128)
+def _fetch_circuit_cached(circuit_id: str, scope: ScopeFilterEnum) -> Circuit:
+    """Fetch a pytket circuit, reusing circuits fetched earlier in the session."""
     res = get_nexus_client().get(
-        f"/api/circuits/v1beta2/{handle.id}",
+        f"/api/circuits/v1beta2/{circuit_id}",
         params={"scope": scope.value},
     )
     if res.status_code != 200:
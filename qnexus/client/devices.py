@@ -1,9 +1,16 @@
 """Client API for devices in Nexus."""
 
+import time
 from enum import Enum
-from typing import Literal
+from typing import Literal, get_args
 
 from qnexus.client import get_nexus_client
+from qnexus.client.utils import (
+    JSON_CONTENT_HEADERS,
+    decode_json,
+    encode_json,
+    map_concurrently,
+)
 from qnexus.exceptions import ResourceFetchFailed
 from qnexus.models import (
     BackendConfig,
@@ -29,10 +36,39 @@ class DeviceStateEnum(str, Enum):
     RESERVED_OFFLINE = "offline, reserved"
 
 
+BackendProperty = Literal[
+    "supports_shots",
+    "supports_counts",
+    "supports_state",
+    "supports_unitary",
+    "supports_density_matrix",
+    "supports_expectation",
+    "expectation_allows_nonhermitian",
+    "supports_contextual_optimisation",
+]
+
+
 class Params(DevicesFilter):
     """Params for filtering devices."""
 
 
+# Device listings rarely change within a session, so they are reused for a
+# short time. The cache is cleared when the nexus client is reloaded, as the
+# available devices depend on the account.
+_DEVICES_CACHE_TTL = 30.0
+_devices_cache: dict[bytes, tuple[float, list[Device]]] = {}
+
+# The properties of a given backend configuration never change.
+_backend_property_cache: dict[tuple[str, BackendProperty], bool] = {}
+
+
+def invalidate_cache() -> None:
+    """Clear the cached device listings and backend properties, so that
+    subsequent calls fetch fresh data from Nexus."""
+    _devices_cache.clear()
+    _backend_property_cache.clear()
+
+
 def get_all(
     issuers: list[IssuerEnum] | None = None,
     aws_region: str | None = None,
@@ -51,11 +87,11 @@ def get_all(
             for config_str in issuer_enum_to_config_str(issuer)
         ]
         if issuers
-        else []
+        else None
     )
 
     params = Params(
-        backend=issuer_config_names if issuer_config_names else None,
+        backend=issuer_config_names,
         region=aws_region,
         ibm_instance=ibm_instance,
         ibm_region=ibm_region,
@@ -64,6 +100,11 @@ def get_all(
         is_local=nexus_hosted,
     ).model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
 
+    cache_key = encode_json(params)
+    cached = _devices_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _DEVICES_CACHE_TTL:
+        return DataframableList(cached[1])
+
     res = get_nexus_client().get(
         "/api/v5/available_devices",
         params=params,
@@ -74,7 +115,7 @@ def get_all(
 
     device_list: DataframableList[Device] = DataframableList([])
 
-    for backendinfolist in res.json():
+    for backendinfolist in decode_json(res):
         for backend_info in backendinfolist["backend_info_list"]:
             # Clean up the backend name for user consumption
             backend_name = backend_info["name"].replace("Backend", "")
@@ -89,6 +130,7 @@ def get_all(
                 )
             )
 
+    _devices_cache[cache_key] = (time.monotonic(), list(device_list))
     return device_list
 
 
@@ -132,6 +174,16 @@ def supports_contextual_optimisation(backend_config: BackendConfig) -> bool:
     return _get_backend_property(backend_config, "supports_contextual_optimisation")
 
 
+def backend_properties(backend_config: BackendConfig) -> dict[BackendProperty, bool]:
+    """Get all the supported backend properties for a backend configuration,
+    e.g. {"supports_shots": True, ...}.
+
+    The properties are requested concurrently, so this is quicker than calling
+    each of the ``supports_*`` functions in turn.
+    """
+    return _get_backend_properties(backend_config, get_args(BackendProperty))
+
+
 def status(backend_config: QuantinuumConfig) -> DeviceStateEnum:
     """Get the status of a hardware-hosted Quantinuum Systems device, such as
     whether is it online or offline.
@@ -149,34 +201,50 @@ def status(backend_config: QuantinuumConfig) -> DeviceStateEnum:
     if res.status_code != 200:
         raise ResourceFetchFailed(message=res.text, status_code=res.status_code)
 
-    return DeviceStateEnum(res.json()["state"])
+    return DeviceStateEnum(decode_json(res)["state"])
+
+
+def _get_backend_properties(
+    backend_config: BackendConfig,
+    properties: tuple[BackendProperty, ...],
+) -> dict[BackendProperty, bool]:
+    """Retrieves several Backend properties for a given BackendConfig, issuing
+    the requests concurrently over the shared client's connection pool."""
+
+    values = map_concurrently(
+        lambda backend_property: _get_backend_property(
+            backend_config, backend_property
+        ),
+        properties,
+        max_workers=len(properties),
+    )
+    return dict(zip(properties, values))
 
 
 def _get_backend_property(
     backend_config: BackendConfig,
-    backend_property: Literal[
-        "supports_shots",
-        "supports_counts",
-        "supports_state",
-        "supports_unitary",
-        "supports_density_matrix",
-        "supports_expectation",
-        "expectation_allows_nonhermitian",
-        "supports_contextual_optimisation",
-    ],
+    backend_property: BackendProperty,
 ) -> bool:
     """Retrieves a Backend property for a given BackendConfig."""
 
+    cache_key = (backend_config.model_dump_json(), backend_property)
+    if cache_key in _backend_property_cache:
+        return _backend_property_cache[cache_key]
+
     res = get_nexus_client().post(
         "/api/v5/backend_info/backend_property",
-        json={
-            "backend_config": backend_config.model_dump(),
-            "property": backend_property,
-        },
+        content=encode_json(
+            {
+                "backend_config": backend_config.model_dump(),
+                "property": backend_property,
+            }
+        ),
+        headers=JSON_CONTENT_HEADERS,
     )
     if res.status_code != 200:
         raise ResourceFetchFailed(message=res.text, status_code=res.status_code)
 
-    property_value: bool = res.json()
+    property_value: bool = decode_json(res)
 
+    _backend_property_cache[cache_key] = property_value
     return property_value
@@ -8,7 +8,14 @@ from uuid import UUID
 import qnexus.exceptions as qnx_exc
 from qnexus.client import get_nexus_client
 from qnexus.client.nexus_iterator import NexusIterator
-from qnexus.client.utils import handle_fetch_errors
+from qnexus.client.utils import (
+    JSON_CONTENT_HEADERS,
+    decode_json,
+    encode_json,
+    handle_fetch_errors,
+    index_included,
+    project_ref_resolver,
+)
 from qnexus.context import (
     get_active_project,
     merge_project_from_context,
@@ -86,6 +93,7 @@ def get_all(
         params=params,
         wrapper_method=_to_gpu_decoder_config_ref,
         nexus_client=get_nexus_client(),
+        prefetch_pages=4,
     )
 
 
@@ -98,21 +106,14 @@ def _to_gpu_decoder_config_ref(
         []
     )
 
+    project_of = project_ref_resolver(index_included(page_json["included"]))
+
     for gpu_decoder_config_data in page_json["data"]:
-        project_id = gpu_decoder_config_data["relationships"]["project"]["data"]["id"]
-        project_details = next(
-            proj for proj in page_json["included"] if proj["id"] == project_id
-        )
-        project = ProjectRef(
-            id=project_id,
-            annotations=Annotations.from_dict(project_details["attributes"]),
-            contents_modified=project_details["attributes"]["contents_modified"],
-            archived=project_details["attributes"]["archived"],
-        )
+        project = project_of(gpu_decoder_config_data)
 
         gpu_decoder_config_refs.append(
             GpuDecoderConfigRef(
-                id=UUID(gpu_decoder_config_data["id"]),
+                id=gpu_decoder_config_data["id"],
                 annotations=Annotations.from_dict(
                     gpu_decoder_config_data["attributes"]
                 ),
@@ -196,7 +197,11 @@ def upload(
         }
     }
 
-    res = get_nexus_client().post("/api/gpu_decoder_configs/v1beta", json=req_dict)
+    res = get_nexus_client().post(
+        "/api/gpu_decoder_configs/v1beta",
+        content=encode_json(req_dict),
+        headers=JSON_CONTENT_HEADERS,
+    )
 
     # https://cqc.atlassian.net/browse/MUS-3054
     if res.status_code != 201:
@@ -204,10 +209,10 @@ def upload(
             message=res.text, status_code=res.status_code
         )
 
-    res_data_dict = res.json()["data"]
+    res_data_dict = decode_json(res)["data"]
 
     return GpuDecoderConfigRef(
-        id=UUID(res_data_dict["id"]),
+        id=res_data_dict["id"],
         annotations=Annotations.from_dict(res_data_dict["attributes"]),
         project=project,
     )
@@ -221,13 +226,11 @@ def update(
     properties: PropertiesDict | None = None,
 ) -> GpuDecoderConfigRef:
     """Update the annotations on a GpuDecoderConfigRef."""
-    ref_annotations = ref.annotations.model_dump()
     annotations = Annotations(
         name=name,
         description=description,
         properties=properties if properties else PropertiesDict(),
     ).model_dump(exclude_none=True)
-    ref_annotations.update(annotations)
 
     req_dict = {
         "data": {
@@ -238,7 +241,9 @@ def update(
     }
 
     res = get_nexus_client().patch(
-        f"/api/gpu_decoder_configs/v1beta/{ref.id}", json=req_dict
+        f"/api/gpu_decoder_configs/v1beta/{ref.id}",
+        content=encode_json(req_dict),
+        headers=JSON_CONTENT_HEADERS,
     )
 
     if res.status_code != 200:
@@ -246,10 +251,10 @@ def update(
             message=res.text, status_code=res.status_code
         )
 
-    res_dict = res.json()["data"]
+    res_dict = decode_json(res)["data"]
 
     return GpuDecoderConfigRef(
-        id=UUID(res_dict["id"]),
+        id=res_dict["id"],
         annotations=Annotations.from_dict(res_dict["attributes"]),
         project=ref.project,
     )
@@ -260,31 +265,21 @@ def _fetch_by_id(
     gpu_decoder_config_id: UUID | str, scope: ScopeFilterEnum = ScopeFilterEnum.USER
 ) -> GpuDecoderConfigRef:
     """Utility method for fetching directly by a unique identifier."""
-    params = Params(
-        scope=scope,
-    ).model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
-
     res = get_nexus_client().get(
-        f"/api/gpu_decoder_configs/v1beta/{gpu_decoder_config_id}", params=params
+        f"/api/gpu_decoder_configs/v1beta/{gpu_decoder_config_id}",
+        params={"scope": scope.value},
     )
 
     handle_fetch_errors(res)
 
-    res_dict = res.json()
+    res_dict = decode_json(res)
 
-    project_id = res_dict["data"]["relationships"]["project"]["data"]["id"]
-    project_details = next(
-        proj for proj in res_dict["included"] if proj["id"] == project_id
-    )
-    project = ProjectRef(
-        id=project_id,
-        annotations=Annotations.from_dict(project_details["attributes"]),
-        contents_modified=project_details["attributes"]["contents_modified"],
-        archived=project_details["attributes"]["archived"],
+    project = project_ref_resolver(index_included(res_dict["included"]))(
+        res_dict["data"]
     )
 
     return GpuDecoderConfigRef(
-        id=UUID(res_dict["data"]["id"]),
+        id=res_dict["data"]["id"],
         annotations=Annotations.from_dict(res_dict["data"]["attributes"]),
         project=project,
     )
@@ -302,4 +297,4 @@ def _fetch_gpu_decoder_config(
     if res.status_code != 200:
         raise qnx_exc.ResourceFetchFailed(message=res.text, status_code=res.status_code)
 
-    return base64.b64decode(res.json()["data"]["attributes"]["contents"]).decode()
+    return base64.b64decode(decode_json(res)["data"]["attributes"]["contents"]).decode()
@@ -16,7 +16,14 @@ from hugr.package import Package, PackagePointer
 import qnexus.exceptions as qnx_exc
 from qnexus.client import get_nexus_client
 from qnexus.client.nexus_iterator import NexusIterator
-from qnexus.client.utils import handle_fetch_errors
+from qnexus.client.utils import (
+    JSON_CONTENT_HEADERS,
+    decode_json,
+    encode_json,
+    handle_fetch_errors,
+    index_included,
+    project_ref_resolver,
+)
 from qnexus.context import (
     get_active_project,
     merge_project_from_context,
@@ -100,6 +107,7 @@ def get_all(
         params=params,
         wrapper_method=_to_hugr_ref,
         nexus_client=get_nexus_client(),
+        prefetch_pages=4,
     )
 
 
@@ -108,21 +116,14 @@ def _to_hugr_ref(page_json: dict[str, Any]) -> DataframableList[HUGRRef]:
 
     hugr_refs: DataframableList[HUGRRef] = DataframableList([])
 
+    project_of = project_ref_resolver(index_included(page_json["included"]))
+
     for hugr_data in page_json["data"]:
-        project_id = hugr_data["relationships"]["project"]["data"]["id"]
-        project_details = next(
-            proj for proj in page_json["included"] if proj["id"] == project_id
-        )
-        project = ProjectRef(
-            id=project_id,
-            annotations=Annotations.from_dict(project_details["attributes"]),
-            contents_modified=project_details["attributes"]["contents_modified"],
-            archived=project_details["attributes"]["archived"],
-        )
+        project = project_of(hugr_data)
 
         hugr_refs.append(
             HUGRRef(
-                id=UUID(hugr_data["id"]),
+                id=hugr_data["id"],
                 annotations=Annotations.from_dict(hugr_data["attributes"]),
                 project=project,
             )
@@ -216,17 +217,19 @@ def upload(
         }
     }
 
-    res = get_nexus_client().post("/api/hugr/v1beta", json=req_dict)
+    res = get_nexus_client().post(
+        "/api/hugr/v1beta", content=encode_json(req_dict), headers=JSON_CONTENT_HEADERS
+    )
 
     if res.status_code != 201:
         raise qnx_exc.ResourceCreateFailed(
             message=res.text, status_code=res.status_code
         )
 
-    res_data_dict = res.json()["data"]
+    res_data_dict = decode_json(res)["data"]
 
     return HUGRRef(
-        id=UUID(res_data_dict["id"]),
+        id=res_data_dict["id"],
         annotations=Annotations.from_dict(res_data_dict["attributes"]),
         project=project,
     )
@@ -240,13 +243,11 @@ def update(
     properties: PropertiesDict | None = None,
 ) -> HUGRRef:
     """Update the annotations on a HUGRRef."""
-    ref_annotations = ref.annotations.model_dump()
     annotations = Annotations(
         name=name,
         description=description,
         properties=properties if properties else PropertiesDict(),
     ).model_dump(exclude_none=True)
-    ref_annotations.update(annotations)
 
     req_dict = {
         "data": {
@@ -256,17 +257,21 @@ def update(
         }
     }
 
-    res = get_nexus_client().patch(f"/api/hugr/v1beta/{ref.id}", json=req_dict)
+    res = get_nexus_client().patch(
+        f"/api/hugr/v1beta/{ref.id}",
+        content=encode_json(req_dict),
+        headers=JSON_CONTENT_HEADERS,
+    )
 
     if res.status_code != 200:
         raise qnx_exc.ResourceUpdateFailed(
             message=res.text, status_code=res.status_code
         )
 
-    res_dict = res.json()["data"]
+    res_dict = decode_json(res)["data"]
 
     return HUGRRef(
-        id=UUID(res_dict["id"]),
+        id=res_dict["id"],
         annotations=Annotations.from_dict(res_dict["attributes"]),
         project=ref.project,
     )
@@ -307,30 +312,20 @@ def _fetch_by_id(
     hugr_id: UUID | str, scope: ScopeFilterEnum = ScopeFilterEnum.USER
 ) -> HUGRRef:
     """Utility method for fetching directly by a unique identifier."""
-
-    params = Params(
-        scope=scope,
-    ).model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
-
-    res = get_nexus_client().get(f"/api/hugr/v1beta/{hugr_id}", params=params)
+    res = get_nexus_client().get(
+        f"/api/hugr/v1beta/{hugr_id}", params={"scope": scope.value}
+    )
 
     handle_fetch_errors(res)
 
-    res_dict = res.json()
+    res_dict = decode_json(res)
 
-    project_id = res_dict["data"]["relationships"]["project"]["data"]["id"]
-    project_details = next(
-        proj for proj in res_dict["included"] if proj["id"] == project_id
-    )
-    project = ProjectRef(
-        id=project_id,
-        annotations=Annotations.from_dict(project_details["attributes"]),
-        contents_modified=project_details["attributes"]["contents_modified"],
-        archived=project_details["attributes"]["archived"],
+    project = project_ref_resolver(index_included(res_dict["included"]))(
+        res_dict["data"]
     )
 
     return HUGRRef(
-        id=UUID(res_dict["data"]["id"]),
+        id=res_dict["data"]["id"],
         annotations=Annotations.from_dict(res_dict["data"]["attributes"]),
         project=project,
     )
@@ -358,10 +353,10 @@ def _fetch_hugr_bytes(
     if res.status_code != 200:
         raise qnx_exc.ResourceFetchFailed(message=res.text, status_code=res.status_code)
 
-    contents = res.json()["data"]["attributes"]["contents"]
+    contents = decode_json(res)["data"]["attributes"]["contents"]
     return base64.b64decode(contents)
 
 
 def _encode_hugr(hugr_package: Package) -> str:
     """Utility method for encoding a HUGR Package as base64-encoded string"""
-    return base64.b64encode(hugr_package.to_bytes()).decode("utf-8")
+    return base64.b64encode(hugr_package.to_bytes()).decode("ascii")
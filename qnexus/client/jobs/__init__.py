@@ -1,14 +1,18 @@
 """Client API for jobs in Nexus."""
 
 import asyncio
-import json
+import random
 import ssl
+import threading
+import time
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Type, Union, cast, overload
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Type, Union, cast, overload
 from uuid import UUID
 
 import httpx
+from pydantic_core import from_json
 from quantinuum_schemas.models.backend_config import config_name_to_class
 from quantinuum_schemas.models.hypertket_config import HyperTketConfig
 from websockets.asyncio.client import connect, process_exception
@@ -18,7 +22,16 @@ import qnexus.exceptions as qnx_exc
 from qnexus.client import get_nexus_client
 from qnexus.client.jobs import _compile, _execute
 from qnexus.client.nexus_iterator import NexusIterator
-from qnexus.client.utils import accept_circuits_for_programs, handle_fetch_errors
+from qnexus.client.utils import (
+    JSON_CONTENT_HEADERS,
+    accept_circuits_for_programs,
+    decode_json,
+    encode_json,
+    handle_fetch_errors,
+    index_included,
+    map_concurrently,
+    project_ref_resolver,
+)
 from qnexus.config import CONFIG
 from qnexus.context import (
     get_active_project,
@@ -41,7 +54,12 @@ from qnexus.models.filters import (
     SortFilterEnum,
     TimeFilter,
 )
-from qnexus.models.job_status import WAITING_STATUS, JobStatus, JobStatusEnum
+from qnexus.models.job_status import (
+    TERMINAL_STATUS,
+    WAITING_STATUS,
+    JobStatus,
+    JobStatusEnum,
+)
 from qnexus.models.language import Language
 from qnexus.models.references import (
     CircuitRef,
@@ -65,6 +83,20 @@ from qnexus.models.utils import assert_never
 
 EPOCH_START = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
+# Statuses fetched with a ttl, keyed by job and scope, with the time each was
+# fetched and the time it expires. Oldest entries are evicted first.
+_status_cache: dict[tuple[UUID, ScopeFilterEnum], tuple[float, float, JobStatus]] = {}
+_status_cache_lock = threading.Lock()
+MAX_CACHED_STATUSES = 1024
+
+# Limit on the number of status requests statuses() has in flight at once.
+MAX_CONCURRENT_STATUS_REQUESTS = 16
+
+# Bounds in seconds for the exponential backoff between status websocket
+# reconnections after the connection is dropped.
+RECONNECT_BACKOFF_BASE = 0.5
+RECONNECT_BACKOFF_MAX = 30.0
+
 
 class RemoteRetryStrategy(str, Enum):
     """Strategy to use when retrying jobs.
@@ -142,39 +174,27 @@ def get_all(
         resource_type="Job",
         nexus_url="/api/jobs/v1beta3",
         params=params,
-        wrapper_method=_to_jobref,
+        wrapper_method=_iter_jobrefs,
         nexus_client=get_nexus_client(),
+        prefetch_pages=4,
     )
 
 
-def _to_jobref(data: dict[str, Any]) -> DataframableList[CompileJobRef | ExecuteJobRef]:
-    """Parse a json dictionary into a list of JobRefs."""
+def _iter_jobrefs(data: dict[str, Any]) -> Iterator[CompileJobRef | ExecuteJobRef]:
+    """Parse a json dictionary into JobRefs, one at a time."""
 
-    job_list: list[CompileJobRef | ExecuteJobRef] = []
+    included_by_id = index_included(data["included"])
+    project_of = project_ref_resolver(included_by_id)
 
     for entry in data["data"]:
-        project_id = entry["relationships"]["project"]["data"]["id"]
-
-        project_details = next(
-            proj for proj in data["included"] if proj["id"] == project_id
-        )
-        project = ProjectRef(
-            id=project_id,
-            annotations=Annotations.from_dict(project_details["attributes"]),
-            contents_modified=project_details["attributes"]["contents_modified"],
-            archived=project_details["attributes"]["archived"],
-        )
+        project = project_of(entry)
 
         system_id: str | None = (
             entry["relationships"]["system"]["data"]["id"]
             if "system" in entry["relationships"]
             else None
         )
-        system_details = (
-            next(item for item in data["included"] if item["id"] == system_id)
-            if system_id is not None
-            else None
-        )
+        system_details = included_by_id[system_id] if system_id is not None else None
 
         system = (
             SystemRef(
@@ -194,19 +214,18 @@ def _to_jobref(data: dict[str, Any]) -> DataframableList[CompileJobRef | Execute
             case _:
                 assert_never(entry["attributes"]["job_type"])
 
-        job_list.append(
-            job_type(
-                id=entry["id"],
-                annotations=Annotations.from_dict(entry["attributes"]),
-                job_type=entry["attributes"]["job_type"],
-                last_status=JobStatus.from_dict(entry["attributes"]["status"]).status,
-                last_message=JobStatus.from_dict(entry["attributes"]["status"]).message,
-                last_status_detail=JobStatus.from_dict(entry["attributes"]["status"]),
-                project=project,
-                system=system,
-            )
+        job_status = JobStatus.from_dict(entry["attributes"]["status"])
+
+        yield job_type(
+            id=entry["id"],
+            annotations=Annotations.from_dict(entry["attributes"]),
+            job_type=entry["attributes"]["job_type"],
+            last_status=job_status.status,
+            last_message=job_status.message,
+            last_status_detail=job_status,
+            project=project,
+            system=system,
         )
-    return DataframableList(job_list)
 
 
 @merge_scope_from_context
@@ -260,26 +279,15 @@ def _fetch_by_id(
     job_id: UUID | str, scope: ScopeFilterEnum = ScopeFilterEnum.USER
 ) -> JobRef:
     """Utility method for fetching directly by a unique identifier."""
-    params = Params(
-        scope=scope,
-    ).model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
-
-    res = get_nexus_client().get(f"/api/jobs/v1beta3/{job_id}", params=params)
+    res = get_nexus_client().get(
+        f"/api/jobs/v1beta3/{job_id}", params={"scope": scope.value}
+    )
 
     handle_fetch_errors(res)
 
-    job_data = res.json()
-
-    project_id = job_data["data"]["relationships"]["project"]["data"]["id"]
-    project_details = next(
-        proj for proj in job_data["included"] if proj["id"] == project_id
-    )
-    project = ProjectRef(
-        id=project_id,
-        annotations=Annotations.from_dict(project_details["attributes"]),
-        contents_modified=project_details["attributes"]["contents_modified"],
-        archived=project_details["attributes"]["archived"],
-    )
+    job_data = decode_json(res)
+    included_by_id = index_included(job_data["included"])
+    project = project_ref_resolver(included_by_id)(job_data["data"])
 
     system_id: str | None = (
         job_data["data"]["relationships"]["system"]["data"]["id"]
@@ -287,11 +295,7 @@ def _fetch_by_id(
         else None
     )
 
-    system_details = (
-        next(item for item in job_data["included"] if item["id"] == system_id)
-        if system_id is not None
-        else None
-    )
+    system_details = included_by_id[system_id] if system_id is not None else None
 
     system = (
         SystemRef(
@@ -318,37 +322,58 @@ def _fetch_by_id(
         **backend_config_dict
     )
 
+    job_status = JobStatus.from_dict(job_data["data"]["attributes"]["status"])
+
     return job_type(
         id=job_data["data"]["id"],
         annotations=Annotations.from_dict(job_data["data"]["attributes"]),
         job_type=job_data["data"]["attributes"]["job_type"],
-        last_status=JobStatus.from_dict(
-            job_data["data"]["attributes"]["status"]
-        ).status,
-        last_message=JobStatus.from_dict(
-            job_data["data"]["attributes"]["status"]
-        ).message,
-        last_status_detail=JobStatus.from_dict(
-            job_data["data"]["attributes"]["status"]
-        ),
+        last_status=job_status.status,
+        last_message=job_status.message,
+        last_status_detail=job_status,
         project=project,
         backend_config_store=backend_config,
         system=system,
     )
 
 
+_background_event_loop: asyncio.AbstractEventLoop | None = None
+_background_event_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop, running in a daemon thread, that blocking waits on
+    jobs are run in. Created on first use and reused thereafter."""
+    global _background_event_loop
+    with _background_event_loop_lock:
+        if _background_event_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="qnexus-event-loop", daemon=True
+            ).start()
+            _background_event_loop = loop
+    return _background_event_loop
+
+
 def wait_for(
     job: JobRef,
     wait_for_status: JobStatusEnum = JobStatusEnum.COMPLETED,
     timeout: float | None = 900.0,
 ) -> JobStatus:
     """Check job status until the job is complete (or a specified status)."""
-    job_status = asyncio.run(
+    future = asyncio.run_coroutine_threadsafe(
         asyncio.wait_for(
             listen_job_status(job=job, wait_for_status=wait_for_status),
             timeout=timeout,
-        )
+        ),
+        _background_loop(),
     )
+    try:
+        job_status = future.result()
+    except BaseException:
+        # e.g. KeyboardInterrupt, stop listening rather than leaving it running
+        future.cancel()
+        raise
 
     if (
         job_status.status == JobStatusEnum.ERROR
@@ -375,8 +400,36 @@ def wait_for(
 
 
 @merge_scope_from_context
-def status(job: JobRef, scope: ScopeFilterEnum = ScopeFilterEnum.USER) -> JobStatus:
-    """Get the status of a job."""
+def status(
+    job: JobRef, scope: ScopeFilterEnum = ScopeFilterEnum.USER, ttl: float = 0.0
+) -> JobStatus:
+    """Get the status of a job.
+
+    If the job is already known to be in a terminal status, that status is
+    returned without a request. If ttl is given, a status fetched with a ttl
+    for the job in the same scope within the last ttl seconds is returned
+    rather than making a new request.
+    """
+    if job.last_status in TERMINAL_STATUS and job.last_status_detail is not None:
+        return job.last_status_detail
+    if ttl > 0:
+        with _status_cache_lock:
+            cached = _status_cache.get((job.id, scope))
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[2]
+
+    job_status = _fetch_status(job, scope=scope)
+    if ttl > 0:
+        _cache_status(job, scope, job_status, ttl)
+    _record_status(job, job_status)
+    return job_status
+
+
+@merge_scope_from_context
+def _fetch_status(
+    job: JobRef, scope: ScopeFilterEnum = ScopeFilterEnum.USER
+) -> JobStatus:
+    """Request the status of a job, without recording it anywhere."""
     resp = get_nexus_client().get(
         f"api/jobs/v1beta3/{job.id}/attributes/status",
         params={"scope": scope.value},
@@ -385,9 +438,69 @@ def status(job: JobRef, scope: ScopeFilterEnum = ScopeFilterEnum.USER) -> JobSta
         raise qnx_exc.ResourceFetchFailed(
             message=resp.text, status_code=resp.status_code
         )
-    job_status = JobStatus.from_dict(resp.json())
-    # job.last_status = job_status.status
-    return job_status
+    return JobStatus.from_dict(decode_json(resp))
+
+
+def _cache_status(
+    job: JobRef, scope: ScopeFilterEnum, job_status: JobStatus, ttl: float
+) -> None:
+    """Store a status for reuse within ttl seconds, dropping expired entries
+    and keeping the cache within MAX_CACHED_STATUSES."""
+    with _status_cache_lock:
+        now = time.monotonic()
+        for key in [k for k, entry in _status_cache.items() if entry[1] <= now]:
+            del _status_cache[key]
+        _status_cache.pop((job.id, scope), None)
+        while len(_status_cache) >= MAX_CACHED_STATUSES:
+            del _status_cache[next(iter(_status_cache))]
+        _status_cache[(job.id, scope)] = (now, now + ttl, job_status)
+
+
+def _evict_status(job: JobRef) -> None:
+    """Drop any cached status of a job, in every scope."""
+    with _status_cache_lock:
+        for key in [k for k in _status_cache if k[0] == job.id]:
+            del _status_cache[key]
+
+
+def _record_status(job: JobRef, job_status: JobStatus) -> None:
+    """Update a JobRef with the latest known status of its job."""
+    job.last_status = job_status.status
+    job.last_message = job_status.message
+    job.last_status_detail = job_status
+
+
+def _forget_status(job: JobRef) -> None:
+    """Discard any known status of a job whose status is about to change."""
+    _evict_status(job)
+    job.last_status_detail = None
+
+
+@merge_scope_from_context
+def statuses(
+    jobs: Iterable[JobRef],
+    scope: ScopeFilterEnum = ScopeFilterEnum.USER,
+    ttl: float = 0.0,
+) -> list[JobStatus]:
+    """Get the statuses of several jobs, in the same order, issuing the
+    requests concurrently over the shared client's connection pool."""
+    return map_concurrently(
+        lambda job: status(job, scope=scope, ttl=ttl),
+        list(jobs),
+        max_workers=MAX_CONCURRENT_STATUS_REQUESTS,
+    )
+
+
+def _status_ws_url(job: JobRef) -> str:
+    """URL of the websocket streaming a job's status."""
+    return f"{CONFIG.websockets_url}/api/jobs/v1beta3/{job.id}/attributes/status/ws"
+
+
+@lru_cache(maxsize=2)
+def _websocket_ssl_context(verify: bool) -> ssl.SSLContext:
+    """SSL context for status websockets, built once as loading the
+    certificate store is slow."""
+    return httpx.create_ssl_context(verify=verify)
 
 
 async def listen_job_status(
@@ -395,12 +508,16 @@ async def listen_job_status(
 ) -> JobStatus:
     """Check the Status of a Job via a websocket connection.
     Will use SSO tokens."""
-    job_status = status(job)
-    # logger.debug("Current job status: %s", job_status.status)
-    if job_status.status not in WAITING_STATUS or job_status.status == wait_for_status:
-        return job_status
+    if job.last_status in TERMINAL_STATUS and job.last_status_detail is not None:
+        return job.last_status_detail
+
+    def _finished(job_status: JobStatus) -> bool:
+        return (
+            job_status.status not in WAITING_STATUS
+            or job_status.status == wait_for_status
+        )
 
-    ssl_context = httpx.create_ssl_context(verify=CONFIG.httpx_verify)
+    ssl_context = _websocket_ssl_context(verify=CONFIG.httpx_verify)
 
     def _process_exception(exc: Exception) -> Exception | None:
         """Utility wrapper around process_exception that tells the websockets
@@ -417,38 +534,91 @@ async def listen_job_status(
         # TODO, this cookie will expire frequently
         "Cookie": f"myqos_id={get_nexus_client().auth.cookies.get('myqos_id')}"  # type: ignore
     }
-    async for websocket in connect(
-        f"{CONFIG.websockets_url}/api/jobs/v1beta3/{job.id}/attributes/status/ws",
-        ssl=ssl_context,
-        additional_headers=additional_headers,
-        process_exception=_process_exception,
-        # logger=logger,
-    ):
-        try:
-            async for status_json in websocket:
-                # logger.debug("New status: %s", status_json)
-                job_status = JobStatus.from_dict(json.loads(status_json))
-
-                if (
-                    job_status.status not in WAITING_STATUS
-                    or job_status.status == wait_for_status
-                ):
-                    break
-            break
-        except ConnectionClosed:
-            # logger.debug(
-            #     "Websocket connection closed... attempting to reconnect..."
-            # )
-            continue
-        finally:
+    # The current status is requested over HTTP while the websocket connects,
+    # and taken from whichever of that and the first frame arrives first. The
+    # request runs off the event loop, which wait_for shares between threads.
+    http_status: asyncio.Future[JobStatus] | None = asyncio.ensure_future(
+        asyncio.to_thread(_fetch_status, job)
+    )
+    reconnect_attempt = 0
+    try:
+        async for websocket in connect(
+            _status_ws_url(job),
+            ssl=ssl_context,
+            additional_headers=additional_headers,
+            process_exception=_process_exception,
+            # logger=logger,
+        ):
             try:
-                await websocket.close(code=1000, reason="Client closed connection")
-            except GeneratorExit:
-                pass
-
+                if http_status is not None:
+                    first_frame: asyncio.Future[Any] = asyncio.ensure_future(
+                        websocket.recv()
+                    )
+                    try:
+                        done, _ = await asyncio.wait(
+                            {first_frame, http_status},
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                    finally:
+                        if not first_frame.done():
+                            # Cancelling recv() loses no frames, so they are
+                            # still read below.
+                            first_frame.cancel()
+                            await asyncio.wait({first_frame})
+                    if first_frame in done:
+                        job_status = JobStatus.from_dict(
+                            from_json(first_frame.result())
+                        )
+                        reconnect_attempt = 0
+                        _discard(http_status)
+                    else:
+                        job_status = http_status.result()
+                    http_status = None
+                    # logger.debug("Current job status: %s", job_status.status)
+                    if _finished(job_status):
+                        break
+
+                async for status_json in websocket:
+                    # logger.debug("New status: %s", status_json)
+                    job_status = JobStatus.from_dict(from_json(status_json))
+                    reconnect_attempt = 0
+
+                    if _finished(job_status):
+                        break
+                break
+            except ConnectionClosed:
+                # logger.debug(
+                #     "Websocket connection closed... attempting to reconnect..."
+                # )
+                await asyncio.sleep(
+                    min(
+                        RECONNECT_BACKOFF_MAX,
+                        RECONNECT_BACKOFF_BASE * 2**reconnect_attempt,
+                    )
+                    + random.random() * 0.25
+                )
+                reconnect_attempt = min(reconnect_attempt + 1, 16)
+                continue
+            finally:
+                try:
+                    await websocket.close(code=1000, reason="Client closed connection")
+                except GeneratorExit:
+                    pass
+    finally:
+        if http_status is not None:
+            _discard(http_status)
+
+    _record_status(job, job_status)
     return job_status
 
 
+def _discard(task: asyncio.Future[Any]) -> None:
+    """Cancel a task whose result is no longer needed, without leaving an
+    exception it raised unretrieved."""
+    if not task.cancel() and not task.cancelled():
+        task.exception()
+
+
 @merge_scope_from_context
 @overload
 def results(
@@ -508,8 +678,10 @@ def retry_submission(
 
     res = get_nexus_client().post(
         f"/api/jobs/v1beta3/{job.id}/rpc/retry",
-        json=body,
+        content=encode_json(body),
+        headers=JSON_CONTENT_HEADERS,
     )
+    _forget_status(job)
     if res.status_code != 202:
         res.raise_for_status()
 
@@ -525,6 +697,7 @@ def cancel(job: JobRef, scope: ScopeFilterEnum = ScopeFilterEnum.USER) -> None:
         json={},
         params={"scope": scope.value},
     )
+    _forget_status(job)
 
     if res.status_code != 202:
         res.raise_for_status()
@@ -537,6 +710,7 @@ def delete(job: JobRef, scope: ScopeFilterEnum = ScopeFilterEnum.USER) -> None:
         f"/api/jobs/v1beta3/{job.id}",
         params={"scope": scope.value},
     )
+    _evict_status(job)
 
     if res.status_code != 204:
         res.raise_for_status()
@@ -581,10 +755,10 @@ def compile(
 
     compile_results = results(compile_job_ref)
 
-    compiled_circuits: list[CircuitRef] = []
+    compilation_refs: list[CompilationResultRef] = []
     for compile_result in compile_results:
         if isinstance(compile_result, CompilationResultRef):
-            compiled_circuits.append(compile_result.get_output())
+            compilation_refs.append(compile_result)
         elif isinstance(compile_result, IncompleteJobItemRef):
             raise qnx_exc.ResourceFetchFailed(
                 f"Compile job item {compile_result.job_item_integer_id} is in status {compile_result.last_status}"
@@ -592,7 +766,13 @@ def compile(
         else:
             assert_never(compile_result)
 
-    return DataframableList(compiled_circuits)
+    return DataframableList(
+        map_concurrently(
+            CompilationResultRef.get_output,
+            compilation_refs,
+            max_workers=_compile.MAX_CONCURRENT_FETCHES,
+        )
+    )
 
 
 @accept_circuits_for_programs
@@ -640,10 +820,10 @@ def execute(
 
     execute_results = results(execute_job_ref)
 
-    ex_results: list[ExecutionResult] = []
+    result_refs: list[ExecutionResultRef] = []
     for result in execute_results:
         if isinstance(result, ExecutionResultRef):
-            ex_results.append(result.download_result())
+            result_refs.append(result)
         elif isinstance(result, IncompleteJobItemRef):
             raise qnx_exc.ResourceFetchFailed(
                 f"Compile job item {result.job_item_integer_id} is in status {result.last_status}"
@@ -651,7 +831,11 @@ def execute(
         else:
             assert_never(result)
 
-    return ex_results
+    return map_concurrently(
+        lambda result_ref: result_ref.download_result(),
+        result_refs,
+        max_workers=_compile.MAX_CONCURRENT_FETCHES,
+    )
 
 
 @merge_scope_from_context
@@ -667,7 +851,7 @@ def cost(
         raise qnx_exc.ResourceFetchFailed(
             message=resp.text, status_code=resp.status_code
         )
-    resp_data = resp.json()["data"]
+    resp_data = decode_json(resp)["data"]
     job_status = resp_data["attributes"]["status"]
     cost = job_status.get("cost")
     return float(cost) if cost is not None else 0.0
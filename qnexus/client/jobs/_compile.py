@@ -1,13 +1,19 @@
 """Client API for compilation in Nexus."""
 
-from typing import Union, cast
+from typing import Any, Union, cast
 
 from quantinuum_schemas.models.hypertket_config import HyperTketConfig
 
 import qnexus.exceptions as qnx_exc
 from qnexus.client import circuits as circuit_api
 from qnexus.client import get_nexus_client
-from qnexus.client.utils import accept_circuits_for_programs
+from qnexus.client.utils import (
+    JSON_CONTENT_HEADERS,
+    accept_circuits_for_programs,
+    decode_json,
+    encode_json,
+    map_concurrently,
+)
 from qnexus.context import (
     get_active_project,
     merge_properties_from_context,
@@ -28,6 +34,10 @@ from qnexus.models.references import (
 )
 from qnexus.models.scope import ScopeFilterEnum
 
+# Upper bound on the number of compilation records or circuits requested
+# concurrently when collecting the results of a compile job.
+MAX_CONCURRENT_FETCHES = 16
+
 
 @accept_circuits_for_programs
 @merge_properties_from_context
@@ -100,13 +110,14 @@ def start_compile_job(
 
     resp = get_nexus_client().post(
         "/api/jobs/v1beta3",
-        json=req_dict,
+        content=encode_json(req_dict),
+        headers=JSON_CONTENT_HEADERS,
     )
     if resp.status_code != 202:
         raise qnx_exc.ResourceCreateFailed(
             message=resp.text, status_code=resp.status_code
         )
-    res_data_dict = resp.json()["data"]
+    res_data_dict = decode_json(resp)["data"]
     return CompileJobRef(
         id=res_data_dict["id"],
         annotations=Annotations.from_dict(res_data_dict["attributes"]),
@@ -135,43 +146,53 @@ def _results(
         raise qnx_exc.ResourceFetchFailed(
             message=resp.text, status_code=resp.status_code
         )
-    resp_data = resp.json()["data"]
+    resp_data = decode_json(resp)["data"]
 
     job_status = resp_data["attributes"]["status"]["status"]
 
     if job_status != "COMPLETED" and allow_incomplete is not True:
         raise qnx_exc.ResourceFetchFailed(message=f"Job status: {job_status}")
 
+    items = resp_data["attributes"]["definition"]["items"]
+    completed_items = [
+        item for item in items if item["status"]["status"] == "COMPLETED"
+    ]
+    compilation_records = dict(
+        map_concurrently(
+            lambda item: (
+                item["compilation_id"],
+                _fetch_compilation_record(item["compilation_id"], scope),
+            ),
+            completed_items,
+            max_workers=MAX_CONCURRENT_FETCHES,
+        )
+    )
+
     compilation_refs: DataframableList[CompilationResultRef | IncompleteJobItemRef] = (
         DataframableList([])
     )
 
-    for item in resp_data["attributes"]["definition"]["items"]:
-        if item["status"]["status"] == "COMPLETED":
-            compilation_id = item["compilation_id"]
-            comp_record_resp = get_nexus_client().get(
-                f"/api/compilations/v1beta3/{compilation_id}",
-                params={"scope": scope.value},
-            )
+    # Compilations of one job share a project, so its ref is built once.
+    projects: dict[str, ProjectRef] = {}
 
-            if comp_record_resp.status_code != 200:
-                raise qnx_exc.ResourceFetchFailed(
-                    message=comp_record_resp.text,
-                    status_code=comp_record_resp.status_code,
-                )
-
-            comp_json = comp_record_resp.json()
+    for item in items:
+        if item["status"]["status"] == "COMPLETED":
+            comp_json = compilation_records[item["compilation_id"]]
 
             project_id = comp_json["data"]["relationships"]["project"]["data"]["id"]
-            project_details = next(
-                proj for proj in comp_json["included"] if proj["id"] == project_id
-            )
-            project = ProjectRef(
-                id=project_id,
-                annotations=Annotations.from_dict(project_details["attributes"]),
-                contents_modified=project_details["attributes"]["contents_modified"],
-                archived=project_details["attributes"]["archived"],
-            )
+            if project_id not in projects:
+                project_details = next(
+                    proj for proj in comp_json["included"] if proj["id"] == project_id
+                )
+                projects[project_id] = ProjectRef(
+                    id=project_id,
+                    annotations=Annotations.from_dict(project_details["attributes"]),
+                    contents_modified=project_details["attributes"][
+                        "contents_modified"
+                    ],
+                    archived=project_details["attributes"]["archived"],
+                )
+            project = projects[project_id]
 
             compilation_refs.append(
                 CompilationResultRef(
@@ -198,6 +219,24 @@ def _results(
     return compilation_refs
 
 
+def _fetch_compilation_record(
+    compilation_id: str, scope: ScopeFilterEnum
+) -> dict[str, Any]:
+    """Get the JSON record of a single compilation."""
+    resp = get_nexus_client().get(
+        f"/api/compilations/v1beta3/{compilation_id}",
+        params={"scope": scope.value},
+    )
+
+    if resp.status_code != 200:
+        raise qnx_exc.ResourceFetchFailed(
+            message=resp.text,
+            status_code=resp.status_code,
+        )
+
+    return cast(dict[str, Any], decode_json(resp))
+
+
 @merge_scope_from_context
 def _fetch_compilation_output(
     compilation_result_ref: CompilationResultRef,
@@ -215,7 +254,7 @@ def _fetch_compilation_output(
             message=resp.text, status_code=resp.status_code
         )
 
-    res_dict = resp.json()
+    res_dict = decode_json(resp)
     relationships = res_dict["data"]["relationships"]
 
     compiled_circuit_id = relationships["compiled_circuit"]["data"]["id"]
@@ -246,30 +285,38 @@ def _fetch_compilation_passes(
             message=resp.text, status_code=resp.status_code
         )
 
-    pass_json = resp.json()
+    pass_json = decode_json(resp)
     pass_list: DataframableList[CompilationPassRef] = DataframableList([])
 
-    for pass_info in pass_json["data"]:
-        pass_name = pass_info["attributes"]["pass_name"]
-
-        pass_input_circuit_id = pass_info["relationships"]["original_circuit"]["data"][
-            "id"
-        ]
-        pass_input_circuit = circuit_api._fetch_by_id(
-            pass_input_circuit_id,
+    # The output of one pass is usually the input of the next, so each
+    # circuit is only fetched once.
+    circuit_ids = list(
+        dict.fromkeys(
+            pass_info["relationships"][circuit]["data"]["id"]
+            for pass_info in pass_json["data"]
+            for circuit in ("original_circuit", "compiled_circuit")
         )
-        pass_output_circuit_id = pass_info["relationships"]["compiled_circuit"]["data"][
-            "id"
-        ]
-        pass_output_circuit = circuit_api._fetch_by_id(
-            pass_output_circuit_id,
+    )
+    circuits = dict(
+        zip(
+            circuit_ids,
+            map_concurrently(
+                lambda circuit_id: circuit_api._fetch_by_id_cached(circuit_id, scope),
+                circuit_ids,
+                max_workers=MAX_CONCURRENT_FETCHES,
+            ),
         )
+    )
 
+    for pass_info in pass_json["data"]:
+        relationships = pass_info["relationships"]
         pass_list.append(
             CompilationPassRef(
-                pass_name=pass_name,
-                input_circuit=pass_input_circuit,
-                output_circuit=pass_output_circuit,
+                pass_name=pass_info["attributes"]["pass_name"],
+                input_circuit=circuits[relationships["original_circuit"]["data"]["id"]],
+                output_circuit=circuits[
+                    relationships["compiled_circuit"]["data"]["id"]
+                ],
                 id=pass_info["id"],
             )
         )
@@ -11,7 +11,12 @@ from qnexus.client import circuits as circuit_api
 from qnexus.client import get_nexus_client
 from qnexus.client import hugr as hugr_api
 from qnexus.client import qir as qir_api
-from qnexus.client.utils import accept_circuits_for_programs
+from qnexus.client.utils import (
+    JSON_CONTENT_HEADERS,
+    accept_circuits_for_programs,
+    decode_json,
+    encode_json,
+)
 from qnexus.context import (
     get_active_project,
     merge_properties_from_context,
@@ -120,16 +125,18 @@ def start_execute_job(
 
     resp = get_nexus_client().post(
         "/api/jobs/v1beta3",
-        json=req_dict,
+        content=encode_json(req_dict),
+        headers=JSON_CONTENT_HEADERS,
     )
     if resp.status_code != 202:
         raise qnx_exc.ResourceCreateFailed(
             message=resp.text, status_code=resp.status_code
         )
+    res_data_dict = decode_json(resp)["data"]
 
     return ExecuteJobRef(
-        id=resp.json()["data"]["id"],
-        annotations=Annotations.from_dict(resp.json()["data"]["attributes"]),
+        id=res_data_dict["id"],
+        annotations=Annotations.from_dict(res_data_dict["attributes"]),
         job_type=JobType.EXECUTE,
         last_status=JobStatusEnum.SUBMITTED,
         last_message="",
@@ -154,7 +161,7 @@ def _results(
         raise qnx_exc.ResourceFetchFailed(
             message=resp.text, status_code=resp.status_code
         )
-    resp_data = resp.json()["data"]
+    resp_data = decode_json(resp)["data"]
     job_status = resp_data["attributes"]["status"]["status"]
 
     if job_status != "COMPLETED" and allow_incomplete is not True:
@@ -237,7 +244,7 @@ def _fetch_pytket_execution_result(
     if res.status_code != 200:
         raise qnx_exc.ResourceFetchFailed(message=res.text, status_code=res.status_code)
 
-    res_dict = res.json()
+    res_dict = decode_json(res)
     program_data = res_dict["data"]["relationships"]["program"]["data"]
     program_id = program_data["id"]
     program_type = program_data["type"]
@@ -245,7 +252,7 @@ def _fetch_pytket_execution_result(
     input_program: CircuitRef | QIRRef
     match program_type:
         case "circuit":
-            input_program = circuit_api._fetch_by_id(program_id)
+            input_program = circuit_api._fetch_by_id_cached(program_id, scope)
         case "qir":
             input_program = qir_api._fetch_by_id(program_id)
         case _:
@@ -292,7 +299,7 @@ def _fetch_qsys_execution_result(
 
     # This is only needed to be set once, as subsequent calls will
     # return the same information for the relationships.
-    res_dict = res.json()
+    res_dict = decode_json(res)
     input_program_id = res_dict["data"]["relationships"]["program"]["data"]["id"]
 
     input_program: HUGRRef | QIRRef
@@ -346,7 +353,7 @@ def _fetch_qsys_execution_result(
                 [
                     line
                     for line in QIRResult(
-                        partial.json()["data"]["attributes"]["results"]
+                        decode_json(partial)["data"]["attributes"]["results"]
                     ).results.splitlines()
                     if "OUTPUT" in line
                 ]
@@ -355,7 +362,7 @@ def _fetch_qsys_execution_result(
                 prev_str + next_str + "END\t0\n"
             )  # join everything back up
         else:
-            next_res = QsysResult(partial.json()["data"]["attributes"]["results"])
+            next_res = QsysResult(decode_json(partial)["data"]["attributes"]["results"])
             result.results.extend(next_res.results)
 
     return (
@@ -3,16 +3,27 @@ iterated type T into a python Iterator."""
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Generic, Iterator, List, TypeVar
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, TypeVar
 
 import httpx
 import pandas as pd
 
 import qnexus.exceptions as qnx_exc
+from qnexus.client.utils import decode_json
 from qnexus.models.references import Dataframable, DataframableList
 
 T = TypeVar("T", bound=Dataframable)
 
+# Shared by all iterators that read pages ahead of the consumer.
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="qnexus-prefetch"
+)
+
+# Page size Nexus uses when a request doesn't set page[size].
+DEFAULT_PAGE_SIZE = 50
+
 
 class NexusIterator(Generic[T], Iterator[T]):
     """An object that can be used to summarize or iterate through a filter query made to
@@ -23,8 +34,9 @@ class NexusIterator(Generic[T], Iterator[T]):
         resource_type: str,
         nexus_url: str,
         params: Dict[str, Any],
-        wrapper_method: Callable[[dict[str, Any]], List[T]],
+        wrapper_method: Callable[[dict[str, Any]], Iterable[T]],
         nexus_client: httpx.Client,
+        prefetch_pages: int = 0,
     ) -> None:
         self.nexus_client = nexus_client
         self.resource_type = resource_type
@@ -32,8 +44,11 @@ class NexusIterator(Generic[T], Iterator[T]):
         self.wrapper = wrapper_method
         self.current_page: int = 0
         self.params = params
+        self.prefetch_pages = prefetch_pages
         self._cached_list: DataframableList[T] | None = None
         self._current_page_subiterator: Iterator[T] = iter([])
+        self._prefetched: deque[Future[httpx.Response]] = deque()
+        self._full_page_size: int = self.params.get("page[size]", DEFAULT_PAGE_SIZE)
 
     def __iter__(self) -> Iterator[T]:
         """Return the Iterator."""
@@ -44,17 +59,49 @@ class NexusIterator(Generic[T], Iterator[T]):
         try:
             return next(self._current_page_subiterator)
         except StopIteration as exc:
-            self.params["page[number]"] = (self.current_page,)
-            res = self.nexus_client.get(url=self.nexus_url, params=self.params)
-
-            self._handle_errors(res)
+            try:
+                if self._prefetched:
+                    res = self._prefetched.popleft().result()
+                else:
+                    res = self._get_page(self.current_page)
+                self._handle_errors(res)
+            except Exception:
+                # Pages read ahead may be out of date by the time the consumer
+                # retries, so request them all again from the failed page.
+                self._discard_prefetched()
+                raise
             self.current_page += 1
 
-            if res.json()["data"]:
-                self._current_page_subiterator = iter(self.wrapper(res.json()))
+            page_json = decode_json(res)
+            if page_json["data"]:
+                self._prefetch(len(page_json["data"]))
+                self._current_page_subiterator = iter(self.wrapper(page_json))
                 return next(self._current_page_subiterator)
             raise StopIteration from exc
 
+    def _get_page(self, page_number: int) -> httpx.Response:
+        """Request a single page of results."""
+        params = {**self.params, "page[number]": (page_number,)}
+        return self.nexus_client.get(url=self.nexus_url, params=params)
+
+    def _prefetch(self, page_length: int) -> None:
+        """Request up to `prefetch_pages` pages ahead of the one being consumed,
+        unless this page was shorter than the requested page size, i.e. the
+        last one."""
+        if page_length < self._full_page_size:
+            return
+        next_page = self.current_page + len(self._prefetched)
+        while len(self._prefetched) < self.prefetch_pages:
+            self._prefetched.append(
+                _prefetch_executor.submit(self._get_page, next_page)
+            )
+            next_page += 1
+
+    def _discard_prefetched(self) -> None:
+        """Forget any pages read ahead of the one being consumed."""
+        while self._prefetched:
+            self._prefetched.popleft().cancel()
+
     def list(self) -> DataframableList[T]:
         """Collapse into RefList."""
         if not self._cached_list:
@@ -76,7 +123,7 @@ class NexusIterator(Generic[T], Iterator[T]):
 
         self._handle_errors(res)
 
-        res_dict = res.json()
+        res_dict = decode_json(res)
         return int(res_dict["count"])
 
     def summarize(self) -> pd.DataFrame:
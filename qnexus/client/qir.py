@@ -8,7 +8,11 @@ from uuid import UUID
 import qnexus.exceptions as qnx_exc
 from qnexus.client import get_nexus_client
 from qnexus.client.nexus_iterator import NexusIterator
-from qnexus.client.utils import handle_fetch_errors
+from qnexus.client.utils import (
+    handle_fetch_errors,
+    index_included,
+    project_ref_resolver,
+)
 from qnexus.context import (
     get_active_project,
     merge_project_from_context,
@@ -100,17 +104,10 @@ def _to_qir_ref(page_json: dict[str, Any]) -> DataframableList[QIRRef]:
 
     qir_refs: DataframableList[QIRRef] = DataframableList([])
 
+    project_of = project_ref_resolver(index_included(page_json["included"]))
+
     for qir_data in page_json["data"]:
-        project_id = qir_data["relationships"]["project"]["data"]["id"]
-        project_details = next(
-            proj for proj in page_json["included"] if proj["id"] == project_id
-        )
-        project = ProjectRef(
-            id=project_id,
-            annotations=Annotations.from_dict(project_details["attributes"]),
-            contents_modified=project_details["attributes"]["contents_modified"],
-            archived=project_details["attributes"]["archived"],
-        )
+        project = project_of(qir_data)
 
         qir_refs.append(
             QIRRef(
@@ -219,13 +216,11 @@ def update(
     properties: PropertiesDict | None = None,
 ) -> QIRRef:
     """Update the annotations on a QIRRef."""
-    ref_annotations = ref.annotations.model_dump()
     annotations = Annotations(
         name=name,
         description=description,
         properties=properties if properties else PropertiesDict(),
     ).model_dump(exclude_none=True)
-    ref_annotations.update(annotations)
 
     req_dict = {
         "data": {
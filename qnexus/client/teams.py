@@ -44,19 +44,23 @@ def get(name: str, scope: ScopeFilterEnum = ScopeFilterEnum.USER) -> TeamRef:
         },
     )
 
-    if res.status_code == 404 or res.json()["data"] == []:
+    if res.status_code == 404:
         raise qnx_exc.ZeroMatches
 
     if res.status_code != 200:
         raise qnx_exc.ResourceFetchFailed(message=res.text, status_code=res.status_code)
 
+    teams_data = res.json()["data"]
+    if teams_data == []:
+        raise qnx_exc.ZeroMatches
+
     teams_list = [
         TeamRef(
             id=team["id"],
             name=team["attributes"]["name"],
             description=team["attributes"]["description"],
         )
-        for team in res.json()["data"]
+        for team in teams_data
     ]
 
     if len(teams_list) > 1:
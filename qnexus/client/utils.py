@@ -4,15 +4,20 @@ import http
 import json
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Literal, ParamSpec, TypeVar
+from typing import Any, Callable, Literal, ParamSpec, Sequence, TypeVar
 
 from httpx import Response
 from pydantic import BaseModel
+from pydantic_core import from_json, to_json
 
 import qnexus.exceptions as qnx_exc
 from qnexus.config import CONFIG
+from qnexus.models.annotations import Annotations
+from qnexus.models.references import ProjectRef
 
 TokenTypes = Literal["access_token", "refresh_token"]
 
@@ -22,6 +27,61 @@ token_file_from_type = {
 }
 
 
+JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+
+
+def encode_json(body: Any) -> bytes:
+    """Serialize a request body to JSON bytes.
+
+    Uses pydantic-core's encoder rather than the stdlib one httpx applies
+    for the ``json=`` argument, so pass the result as ``content=`` along
+    with ``headers=JSON_CONTENT_HEADERS``. Like the stdlib encoder with
+    ``allow_nan=False``, raises ValueError for NaN or infinite floats, which
+    pydantic-core would otherwise write out as invalid JSON.
+    """
+    content = to_json(body)
+    # Only re-parse when the output might hold a non-finite constant. The
+    # stdlib calls parse_constant for bare constants but not for strings.
+    if b"NaN" in content or b"Infinity" in content:
+        json.loads(content, parse_constant=_reject_non_finite)
+    return content
+
+
+def _reject_non_finite(constant: str) -> Any:
+    """Raise for a NaN or infinite float found in encoded JSON."""
+    raise ValueError(f"Out of range float values are not JSON compliant: {constant}")
+
+
+def decode_json(res: Response) -> Any:
+    """Parse the JSON body of a response.
+
+    Equivalent to ``res.json()``, but parses the raw bytes with pydantic-core's
+    decoder rather than decoding them to text for the stdlib one.
+    """
+    return from_json(res.content)
+
+
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+
+def map_concurrently(
+    func: Callable[[ItemType], ResultType],
+    items: Sequence[ItemType],
+    max_workers: int,
+) -> list[ResultType]:
+    """Apply func to each item on a thread pool, returning results in order.
+
+    Each call runs in a copy of the caller's context, so a project or scope
+    set with ``qnexus.context`` still applies inside the worker threads.
+    """
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(items), max_workers)) as executor:
+        futures = [executor.submit(copy_context().run, func, item) for item in items]
+        return [future.result() for future in futures]
+
+
 def normalize_included(included: list[Any]) -> dict[str, dict[str, Any]]:
     """Convert a JSON API included array into a mapped dict of the form:
     {
@@ -40,6 +100,35 @@ def normalize_included(included: list[Any]) -> dict[str, dict[str, Any]]:
     return included_map
 
 
+def index_included(included: list[Any]) -> dict[str, dict[str, Any]]:
+    """Map the items of a JSON API included array by their id."""
+    return {item["id"]: item for item in included}
+
+
+def project_ref_resolver(
+    included_by_id: dict[str, dict[str, Any]],
+) -> Callable[[dict[str, Any]], ProjectRef]:
+    """Make a function giving the ProjectRef of a resource from a JSON API
+    response, built from the included project, and shared between resources
+    in the same project."""
+    projects: dict[str, ProjectRef] = {}
+
+    def project_of(resource_data: dict[str, Any]) -> ProjectRef:
+        project_id = resource_data["relationships"]["project"]["data"]["id"]
+        project = projects.get(project_id)
+        if project is None:
+            project_details = included_by_id[project_id]
+            project = projects[project_id] = ProjectRef(
+                id=project_id,
+                annotations=Annotations.from_dict(project_details["attributes"]),
+                contents_modified=project_details["attributes"]["contents_modified"],
+                archived=project_details["attributes"]["archived"],
+            )
+        return project
+
+    return project_of
+
+
 def remove_token(token_type: TokenTypes) -> None:
     """Delete a token file."""
     # Don't try to delete refresh token in Jupyterhub
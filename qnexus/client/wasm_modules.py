@@ -10,7 +10,11 @@ from pytket.wasm.wasm import WasmModuleHandler
 import qnexus.exceptions as qnx_exc
 from qnexus.client import get_nexus_client
 from qnexus.client.nexus_iterator import NexusIterator
-from qnexus.client.utils import handle_fetch_errors
+from qnexus.client.utils import (
+    handle_fetch_errors,
+    index_included,
+    project_ref_resolver,
+)
 from qnexus.context import (
     get_active_project,
     merge_project_from_context,
@@ -96,17 +100,10 @@ def _to_wasm_module_ref(page_json: dict[str, Any]) -> DataframableList[WasmModul
 
     wasm_module_refs: DataframableList[WasmModuleRef] = DataframableList([])
 
+    project_of = project_ref_resolver(index_included(page_json["included"]))
+
     for wasm_module_data in page_json["data"]:
-        project_id = wasm_module_data["relationships"]["project"]["data"]["id"]
-        project_details = next(
-            proj for proj in page_json["included"] if proj["id"] == project_id
-        )
-        project = ProjectRef(
-            id=project_id,
-            annotations=Annotations.from_dict(project_details["attributes"]),
-            contents_modified=project_details["attributes"]["contents_modified"],
-            archived=project_details["attributes"]["archived"],
-        )
+        project = project_of(wasm_module_data)
 
         wasm_module_refs.append(
             WasmModuleRef(
@@ -217,13 +214,11 @@ def update(
     properties: PropertiesDict | None = None,
 ) -> WasmModuleRef:
     """Update the annotations on a WasmModuleRef."""
-    ref_annotations = ref.annotations.model_dump()
     annotations = Annotations(
         name=name,
         description=description,
         properties=properties if properties else PropertiesDict(),
     ).model_dump(exclude_none=True)
-    ref_annotations.update(annotations)
 
     req_dict = {
         "data": {
@@ -57,8 +57,8 @@ class JobStatus(NamedTuple):
             raise invalid
 
         try:
-            status = next(s for s in JobStatusEnum if dic["status"] == s.name)
-        except StopIteration as err:
+            status = JobStatusEnum[dic["status"]]
+        except KeyError as err:
             raise invalid from err
 
         error_detail = dic.get("error_detail", None)
@@ -99,4 +99,11 @@ class JobStatus(NamedTuple):
         ).T
 
 
-WAITING_STATUS = {JobStatusEnum.QUEUED, JobStatusEnum.SUBMITTED, JobStatusEnum.RUNNING}
+WAITING_STATUS = frozenset(
+    {JobStatusEnum.QUEUED, JobStatusEnum.SUBMITTED, JobStatusEnum.RUNNING}
+)
+
+# Statuses a job will not leave unless it is retried.
+TERMINAL_STATUS = frozenset(
+    {JobStatusEnum.COMPLETED, JobStatusEnum.CANCELLED, JobStatusEnum.ERROR}
+)
@@ -8,6 +8,8 @@ uv run pytest --cov-reset tests/test_auth.py::test_token_refresh
 uv run pytest tests/test_auth.py::test_nexus_client_reloads_tokens
 uv run pytest tests/test_auth.py::test_nexus_client_reloads_domain
 uv run pytest tests/test_auth.py::test_token_refresh_expired
+uv run pytest tests/test_auth.py::test_concurrent_token_refresh_is_deduplicated
+uv run pytest tests/test_auth.py::test_nexus_client_uses_environment_proxies
 
 
 echo "Running non-auth tests"
@@ -3,15 +3,17 @@
 N.B. these manipulate environment variables so currently run in isolation via scripts/run_unit_test.sh.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Generator
 from uuid import uuid4
 
+import httpcore
 import httpx
 import pytest
 import respx
 
 import qnexus as qnx
-from qnexus.client import _nexus_client, get_nexus_client
+from qnexus.client import CONNECTION_LIMITS, _nexus_client, get_nexus_client
 from qnexus.client.utils import read_token, remove_token, write_token
 from qnexus.config import CONFIG
 from qnexus.exceptions import AuthenticationError
@@ -95,6 +97,53 @@ def test_token_refresh() -> None:
     assert f"myqos_id={refreshed_access_token}" in last_cookie_header
 
 
+@respx.mock
+def test_concurrent_token_refresh_is_deduplicated() -> None:
+    """Test that concurrent requests receiving a 401 share a single refresh.
+
+    Only the first request to acquire the refresh lock should call the refresh
+    endpoint, the rest should retry with the refreshed access token.
+    """
+
+    old_id_token = "dummy_id"
+    refreshed_access_token = "new_dummy_id"
+
+    write_token("refresh_token", "dummy_oat")
+    write_token("access_token", old_id_token)
+    client = get_nexus_client(reload=True)
+
+    def _list_projects(request: httpx.Request) -> httpx.Response:
+        if f"myqos_id={refreshed_access_token}" in request.headers.get("cookie", ""):
+            return httpx.Response(200, json={"included": {}, "data": []})
+        return httpx.Response(401)
+
+    list_project_route = respx.get(f"{client.base_url}/api/projects/v1beta2").mock(
+        side_effect=_list_projects
+    )
+    refresh_token_route = respx.post(f"{client.base_url}/auth/tokens/refresh").mock(
+        return_value=httpx.Response(
+            200,
+            headers={
+                "set-cookie": f"myqos_id={refreshed_access_token}; "
+                "HttpOnly; Path=/; SameSite=Lax; Secure"
+            },
+        )
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(
+            executor.map(
+                lambda _: client.get("/api/projects/v1beta2"),
+                range(8),
+            )
+        )
+
+    assert all(res.status_code == 200 for res in responses)
+    assert list_project_route.call_count >= 8
+    assert refresh_token_route.call_count == 1
+    assert read_token("access_token") == refreshed_access_token
+
+
 @respx.mock
 def test_token_refresh_expired() -> None:
     """Test the case of an expired refresh token, using in-memory token storage."""
@@ -171,3 +220,19 @@ def test_nexus_client_reloads_domain() -> None:
     assert domain_two not in str(client_one.base_url)
     # client_two getter should reload the client
     assert domain_two in str(client_two.base_url)
+
+
+def test_nexus_client_uses_environment_proxies(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The nexus client routes requests through proxies set in the environment."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    write_token("refresh_token", "dummy_oat")
+
+    client = get_nexus_client(reload=True)
+
+    transport = client._transport_for_url(client.base_url)
+    assert isinstance(transport, httpx.HTTPTransport)
+    pool = transport._pool
+    assert isinstance(pool, httpcore.HTTPProxy)
+    assert pool._proxy_url == httpcore.URL("http://proxy.example:3128")
+    # The proxied pool keeps the shared client's connection limits.
+    assert pool._max_connections == CONNECTION_LIMITS.max_connections
@@ -2,10 +2,16 @@
 
 import uuid
 from datetime import datetime
+from typing import Any
 from unittest import mock
 
+import httpx
 import pytest
+from pytket.circuit import Circuit
 
+from qnexus.client import circuits
+from qnexus.client import get_nexus_client as real_get_nexus_client
+from qnexus.client.utils import write_token
 from qnexus.context import using_scope
 from qnexus.models.annotations import Annotations
 from qnexus.models.references import CircuitRef, ProjectRef
@@ -52,3 +58,92 @@ def test_uses_scope_when_downloading_circuit(
         circuit_ref.download_circuit()
 
     fetch_circuit.assert_called_once_with(circuit_ref, scope=expected_scope)
+
+
+def circuit_json(circuit_id: str, project_id: str) -> dict[str, Any]:
+    """The JSON record of a circuit with its project included."""
+    annotations = {
+        "name": "circuit",
+        "timestamps": {
+            "created": datetime.now().isoformat(),
+            "modified": datetime.now().isoformat(),
+        },
+    }
+    return {
+        "data": {
+            "id": circuit_id,
+            "type": "circuit",
+            "attributes": annotations,
+            "relationships": {"project": {"data": {"id": project_id}}},
+        },
+        "included": [
+            {
+                "id": project_id,
+                "type": "project",
+                "attributes": {
+                    **annotations,
+                    "contents_modified": datetime.now().isoformat(),
+                    "archived": False,
+                },
+            }
+        ],
+    }
+
+
+@mock.patch("qnexus.client.circuits.get_nexus_client")
+def test_circuit_refs_are_cached_for_results(get_client: mock.MagicMock) -> None:
+    """Result collection reuses circuit refs until a circuit is updated or the
+    client is reloaded, while circuits.get always asks Nexus."""
+    circuits.invalidate_cache()
+    circuit_id, project_id = str(uuid.uuid4()), str(uuid.uuid4())
+    client = get_client.return_value
+    client.get.return_value = httpx.Response(
+        200, json=circuit_json(circuit_id, project_id)
+    )
+    client.patch.return_value = httpx.Response(
+        200, json={"data": circuit_json(circuit_id, project_id)["data"]}
+    )
+
+    ref = circuits._fetch_by_id_cached(circuit_id, ScopeFilterEnum.USER)
+    assert circuits._fetch_by_id_cached(circuit_id, ScopeFilterEnum.USER) is ref
+    assert client.get.call_count == 1
+
+    circuits._fetch_by_id_cached(circuit_id, ScopeFilterEnum.HIGHEST)
+    assert client.get.call_count == 2
+
+    circuits.get(id=circuit_id)
+    assert client.get.call_count == 3
+
+    circuits.update(ref, name="renamed")
+    circuits._fetch_by_id_cached(circuit_id, ScopeFilterEnum.USER)
+    assert client.get.call_count == 4
+
+    write_token("refresh_token", "dummy_oat")
+    real_get_nexus_client(reload=True)
+    circuits._fetch_by_id_cached(circuit_id, ScopeFilterEnum.USER)
+    assert client.get.call_count == 5
+    circuits.invalidate_cache()
+
+
+@mock.patch("qnexus.client.circuits.get_nexus_client")
+def test_circuit_contents_are_cached_by_id(get_client: mock.MagicMock) -> None:
+    """Refs to the same circuit share one download, and each caller gets its
+    own copy of the circuit."""
+    circuits.invalidate_cache()
+    circuit = Circuit(2).H(0).CX(0, 1)
+    get_client.return_value.get.return_value = httpx.Response(
+        200, json={"data": {"attributes": circuit.to_dict()}}
+    )
+    circuit_id = uuid.uuid4()
+    project = ProjectRef(
+        id=uuid.uuid4(), annotations=Annotations(), contents_modified=datetime.now()
+    )
+
+    first = CircuitRef(id=circuit_id, annotations=Annotations(), project=project)
+    second = CircuitRef(id=circuit_id, annotations=Annotations(), project=project)
+    downloaded = first.download_circuit()
+    downloaded.X(1)
+
+    assert second.download_circuit() == circuit
+    assert get_client.return_value.get.call_count == 1
+    circuits.invalidate_cache()
@@ -0,0 +1,67 @@
+"""Checks for collecting the results of compile jobs."""
+
+import uuid
+from datetime import datetime
+from typing import Any
+from unittest import mock
+
+import httpx
+
+from qnexus.client.jobs._compile import _fetch_compilation_passes
+from qnexus.models.annotations import Annotations
+from qnexus.models.references import CircuitRef, CompilationResultRef, ProjectRef
+from qnexus.models.scope import ScopeFilterEnum
+
+PROJECT = ProjectRef(
+    id=uuid.uuid4(), annotations=Annotations(), contents_modified=datetime.now()
+)
+
+
+def make_circuit_ref(circuit_id: str, scope: ScopeFilterEnum) -> CircuitRef:
+    """A circuit in the test project."""
+    return CircuitRef(id=circuit_id, annotations=Annotations(), project=PROJECT)
+
+
+def pass_json(pass_name: str, input_id: str, output_id: str) -> dict[str, Any]:
+    """The JSON record of a compilation pass."""
+    return {
+        "id": str(uuid.uuid4()),
+        "attributes": {"pass_name": pass_name},
+        "relationships": {
+            "original_circuit": {"data": {"id": input_id}},
+            "compiled_circuit": {"data": {"id": output_id}},
+        },
+    }
+
+
+@mock.patch("qnexus.client.jobs._compile.circuit_api._fetch_by_id_cached")
+@mock.patch("qnexus.client.jobs._compile.get_nexus_client")
+def test_compilation_passes_keep_their_circuits(
+    get_client: mock.MagicMock, fetch_circuit: mock.MagicMock
+) -> None:
+    """Circuits fetched concurrently are matched up with the right passes, and
+    circuits shared between passes are only fetched once."""
+    circuit_ids = [str(uuid.uuid4()) for _ in range(3)]
+    get_client.return_value.get.return_value = httpx.Response(
+        200,
+        json={
+            "data": [
+                pass_json("DecomposeBoxes", circuit_ids[0], circuit_ids[1]),
+                pass_json("FullPeepholeOptimise", circuit_ids[1], circuit_ids[2]),
+            ]
+        },
+    )
+    fetch_circuit.side_effect = make_circuit_ref
+
+    passes = _fetch_compilation_passes(
+        CompilationResultRef(
+            id=uuid.uuid4(), annotations=Annotations(), project=PROJECT
+        )
+    )
+
+    assert [p.pass_name for p in passes] == ["DecomposeBoxes", "FullPeepholeOptimise"]
+    assert [(str(p.input_circuit.id), str(p.output_circuit.id)) for p in passes] == [
+        (circuit_ids[0], circuit_ids[1]),
+        (circuit_ids[1], circuit_ids[2]),
+    ]
+    assert fetch_circuit.call_count == 3
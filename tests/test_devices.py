@@ -0,0 +1,102 @@
+"""Checks for caching of device information."""
+
+import json
+from typing import Any, Generator, get_args
+from unittest import mock
+
+import httpx
+import pytest
+
+import qnexus as qnx
+from qnexus.client import get_nexus_client as real_get_nexus_client
+from qnexus.client.devices import BackendProperty
+from qnexus.client.utils import write_token
+from qnexus.exceptions import ResourceFetchFailed
+from qnexus.models import IssuerEnum
+
+
+@pytest.fixture(autouse=True)
+def clean_device_cache() -> Generator[Any, Any, Any]:
+    """Start and finish each test with empty device caches."""
+    qnx.devices.invalidate_cache()
+    yield
+    qnx.devices.invalidate_cache()
+
+
+@mock.patch("qnexus.client.devices.get_nexus_client")
+def test_backend_property_is_cached(get_client: mock.MagicMock) -> None:
+    """Repeated lookups of a backend property only hit Nexus once."""
+    get_client.return_value.post.return_value = httpx.Response(200, json=True)
+
+    assert qnx.devices.supports_shots(qnx.AerConfig())
+    assert qnx.devices.supports_shots(qnx.AerConfig())
+    assert get_client.return_value.post.call_count == 1
+
+    qnx.devices.invalidate_cache()
+    assert qnx.devices.supports_shots(qnx.AerConfig())
+    assert get_client.return_value.post.call_count == 2
+
+
+@mock.patch("qnexus.client.devices.get_nexus_client")
+def test_backend_properties_are_keyed_and_cached(get_client: mock.MagicMock) -> None:
+    """All backend properties are returned under their own names, and are
+    shared with the cache used by the single property lookups."""
+    supported = {"supports_shots", "supports_counts", "supports_expectation"}
+
+    def _backend_property(url: str, content: bytes, **kwargs: Any) -> httpx.Response:
+        return httpx.Response(200, json=json.loads(content)["property"] in supported)
+
+    get_client.return_value.post.side_effect = _backend_property
+
+    properties = qnx.devices.backend_properties(qnx.AerConfig())
+
+    assert properties == {
+        backend_property: backend_property in supported
+        for backend_property in get_args(BackendProperty)
+    }
+    assert len(properties) == 8
+    assert get_client.return_value.post.call_count == 8
+
+    assert qnx.devices.backend_properties(qnx.AerConfig()) == properties
+    assert qnx.devices.supports_counts(qnx.AerConfig())
+    assert not qnx.devices.supports_state(qnx.AerConfig())
+    assert get_client.return_value.post.call_count == 8
+
+
+@mock.patch("qnexus.client.devices.get_nexus_client")
+def test_get_all_is_cached_per_filter(get_client: mock.MagicMock) -> None:
+    """Device listings are reused for identical filters only."""
+    get_client.return_value.get.return_value = httpx.Response(200, json=[])
+
+    qnx.devices.get_all()
+    qnx.devices.get_all()
+    assert get_client.return_value.get.call_count == 1
+
+    qnx.devices.get_all(issuers=[IssuerEnum.QUANTINUUM])
+    assert get_client.return_value.get.call_count == 2
+
+
+@mock.patch("qnexus.client.devices._DEVICES_CACHE_TTL", 0.0)
+@mock.patch("qnexus.client.devices.get_nexus_client")
+def test_get_all_raises_once_listing_expires(get_client: mock.MagicMock) -> None:
+    """An expired listing is not served when Nexus fails."""
+    get = get_client.return_value.get
+    get.return_value = httpx.Response(200, json=[])
+    qnx.devices.get_all()
+
+    get.return_value = httpx.Response(503, text="unavailable")
+    with pytest.raises(ResourceFetchFailed):
+        qnx.devices.get_all()
+
+
+@mock.patch("qnexus.client.devices.get_nexus_client")
+def test_device_cache_is_cleared_on_client_reload(get_client: mock.MagicMock) -> None:
+    """Listings cached for one account are not reused after a client reload."""
+    get_client.return_value.get.return_value = httpx.Response(200, json=[])
+    qnx.devices.get_all()
+
+    write_token("refresh_token", "dummy_oat")
+    real_get_nexus_client(reload=True)
+
+    qnx.devices.get_all()
+    assert get_client.return_value.get.call_count == 2
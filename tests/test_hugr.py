@@ -2,9 +2,11 @@
 
 import uuid
 from datetime import datetime
+from typing import Any
 
 import pytest
 
+from qnexus.client.hugr import _to_hugr_ref
 from qnexus.exceptions import IncompatibleResultVersion
 from qnexus.models.annotations import Annotations
 from qnexus.models.references import ExecutionResultRef, ProjectRef, ResultVersions
@@ -24,3 +26,38 @@ def test_raises_when_trying_to_get_raw_results_from_pytket_result() -> None:
 
     with pytest.raises(IncompatibleResultVersion):
         ref.download_result(version=ResultVersions.RAW)
+
+
+def test_hugr_page_shares_project_refs() -> None:
+    """HUGRs in the same project on a page of results share one ProjectRef."""
+
+    timestamps = {"created": datetime.now(), "modified": datetime.now()}
+    project_id = str(uuid.uuid4())
+
+    def hugr_data(name: str) -> dict[str, Any]:
+        return {
+            "id": str(uuid.uuid4()),
+            "attributes": {"name": name, "timestamps": timestamps},
+            "relationships": {"project": {"data": {"id": project_id}}},
+        }
+
+    page_json = {
+        "data": [hugr_data("first"), hugr_data("second")],
+        "included": [
+            {
+                "id": project_id,
+                "attributes": {
+                    "name": "project",
+                    "timestamps": timestamps,
+                    "contents_modified": datetime.now(),
+                    "archived": False,
+                },
+            }
+        ],
+    }
+
+    first, second = _to_hugr_ref(page_json)
+
+    assert [first.annotations.name, second.annotations.name] == ["first", "second"]
+    assert first.project is second.project
+    assert first.project.id == uuid.UUID(project_id)
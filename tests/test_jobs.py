@@ -0,0 +1,406 @@
+"""Checks for waiting on job statuses."""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator
+from unittest import mock
+
+import httpx
+import pytest
+from websockets.exceptions import ConnectionClosed
+
+from qnexus.client.jobs import (
+    _status_cache,
+    _status_ws_url,
+    cancel,
+    get_all,
+    listen_job_status,
+    retry_submission,
+    status,
+    statuses,
+    wait_for,
+)
+from qnexus.models.annotations import Annotations
+from qnexus.models.job_status import JobStatus, JobStatusEnum
+from qnexus.models.references import (
+    CompileJobRef,
+    ExecuteJobRef,
+    JobType,
+    ProjectRef,
+)
+from qnexus.models.scope import ScopeFilterEnum
+
+
+def make_job_ref() -> ExecuteJobRef:
+    """A submitted job, with no status detail known."""
+    return ExecuteJobRef(
+        id=uuid.uuid4(),
+        annotations=Annotations(),
+        job_type=JobType.EXECUTE,
+        last_status=JobStatusEnum.SUBMITTED,
+        last_message="",
+        project=ProjectRef(
+            id=uuid.uuid4(), annotations=Annotations(), contents_modified=datetime.now()
+        ),
+    )
+
+
+class FakeWebsocket:
+    """Serves status frames, optionally delaying the first one."""
+
+    def __init__(self, statuses: list[str], first_frame_delay: float = 0.0) -> None:
+        self.frames = [json.dumps({"status": s, "message": ""}) for s in statuses]
+        self.first_frame_delay = first_frame_delay
+
+    async def recv(self) -> str:
+        await asyncio.sleep(self.first_frame_delay)
+        return self.frames.pop(0)
+
+    def __aiter__(self) -> "FakeWebsocket":
+        return self
+
+    async def __anext__(self) -> str:
+        if not self.frames:
+            raise StopAsyncIteration
+        return self.frames.pop(0)
+
+    async def close(self, code: int, reason: str) -> None:
+        pass
+
+
+class DroppedWebsocket(FakeWebsocket):
+    """A connection that is dropped before sending anything."""
+
+    def __init__(self) -> None:
+        super().__init__([])
+
+    async def recv(self) -> str:
+        raise ConnectionClosed(rcvd=None, sent=None)
+
+    async def __anext__(self) -> str:
+        raise ConnectionClosed(rcvd=None, sent=None)
+
+
+def fake_connect(*websockets: FakeWebsocket) -> Any:
+    async def _connect(*args: Any, **kwargs: Any) -> AsyncIterator[FakeWebsocket]:
+        for websocket in websockets:
+            yield websocket
+
+    return _connect
+
+
+def slow_status(job_status: str, delay: float = 0.5) -> Any:
+    """A status request that answers after a delay, from whichever thread it
+    is made in."""
+
+    def _fetch_status(job: ExecuteJobRef) -> JobStatus:
+        time.sleep(delay)
+        return JobStatus(status=JobStatusEnum[job_status])
+
+    return _fetch_status
+
+
+@mock.patch("qnexus.client.jobs._fetch_status", side_effect=slow_status("QUEUED"))
+def test_listen_uses_initial_websocket_frame(fetch_status: mock.MagicMock) -> None:
+    """A first websocket frame arriving before the HTTP status is used."""
+    job = make_job_ref()
+    websocket = FakeWebsocket(["COMPLETED"])
+
+    with mock.patch("qnexus.client.jobs.connect", fake_connect(websocket)):
+        job_status = asyncio.run(listen_job_status(job))
+
+    assert job_status.status == JobStatusEnum.COMPLETED
+    assert job.last_status == JobStatusEnum.COMPLETED
+
+
+@mock.patch("qnexus.client.jobs._fetch_status")
+def test_listen_returns_http_status_without_waiting_for_a_frame(
+    fetch_status: mock.MagicMock,
+) -> None:
+    """A finished job is answered by the HTTP status as soon as it arrives,
+    requested off the event loop, without waiting on the websocket."""
+    job = make_job_ref()
+    status_threads = []
+
+    def _fetch_status(job: ExecuteJobRef) -> JobStatus:
+        status_threads.append(threading.current_thread())
+        return JobStatus(status=JobStatusEnum.COMPLETED)
+
+    fetch_status.side_effect = _fetch_status
+    websocket = FakeWebsocket(["COMPLETED"], first_frame_delay=30.0)
+
+    started = time.monotonic()
+    with mock.patch("qnexus.client.jobs.connect", fake_connect(websocket)):
+        job_status = asyncio.run(listen_job_status(job))
+
+    assert time.monotonic() - started < 5.0
+    assert job_status.status == JobStatusEnum.COMPLETED
+    fetch_status.assert_called_once_with(job)
+    # The blocking request doesn't hold up the event loop.
+    assert status_threads != [threading.current_thread()]
+
+
+@mock.patch("qnexus.client.jobs._fetch_status", side_effect=slow_status("QUEUED", 0))
+def test_listen_follows_frames_after_http_status(fetch_status: mock.MagicMock) -> None:
+    """Frames are still followed when the HTTP status arrives first and the
+    job hasn't finished."""
+    job = make_job_ref()
+    websocket = FakeWebsocket(["RUNNING", "COMPLETED"], first_frame_delay=1.0)
+
+    with mock.patch("qnexus.client.jobs.connect", fake_connect(websocket)):
+        job_status = asyncio.run(listen_job_status(job))
+
+    assert job_status.status == JobStatusEnum.COMPLETED
+    assert websocket.frames == []
+
+
+@mock.patch("qnexus.client.jobs._fetch_status", side_effect=slow_status("QUEUED", 0))
+@mock.patch("qnexus.client.jobs.random.random", return_value=0.0)
+@mock.patch("qnexus.client.jobs.asyncio.sleep")
+def test_listen_backs_off_before_reconnecting(
+    sleep: mock.AsyncMock, _random: mock.MagicMock, _fetch_status: mock.MagicMock
+) -> None:
+    """Reconnections after dropped connections are spaced out exponentially."""
+    job = make_job_ref()
+    websockets = [DroppedWebsocket(), DroppedWebsocket(), FakeWebsocket(["COMPLETED"])]
+
+    with mock.patch("qnexus.client.jobs.connect", fake_connect(*websockets)):
+        job_status = asyncio.run(listen_job_status(job))
+
+    assert job_status.status == JobStatusEnum.COMPLETED
+    assert [c.args for c in sleep.await_args_list if c.args != (0.0,)] == [
+        (0.5,),
+        (1.0,),
+    ]
+
+
+@mock.patch("qnexus.client.jobs.get_nexus_client")
+def test_status_ttl_reuses_recent_status(get_client: mock.MagicMock) -> None:
+    """A status fetched within the ttl is reused, until the job is cancelled."""
+    job = make_job_ref()
+    client = get_client.return_value
+    client.get.return_value = httpx.Response(
+        200, json={"status": "RUNNING", "message": ""}
+    )
+    client.post.return_value = httpx.Response(202)
+
+    assert status(job).status == JobStatusEnum.RUNNING
+    assert (job.id, ScopeFilterEnum.USER) not in _status_cache
+    assert status(job, ttl=60.0).status == JobStatusEnum.RUNNING
+    assert status(job, ttl=60.0).status == JobStatusEnum.RUNNING
+    assert client.get.call_count == 2
+
+    status(job)
+    assert client.get.call_count == 3
+
+    status(job, scope=ScopeFilterEnum.HIGHEST, ttl=60.0)
+    assert client.get.call_count == 4
+
+    cancel(job)
+    status(job, ttl=60.0)
+    assert client.get.call_count == 5
+
+
+@mock.patch("qnexus.client.jobs.MAX_CACHED_STATUSES", 2)
+@mock.patch("qnexus.client.jobs.get_nexus_client")
+def test_status_cache_is_bounded(get_client: mock.MagicMock) -> None:
+    """The oldest cached status is evicted once the cache is full."""
+    _status_cache.clear()
+    get_client.return_value.get.return_value = httpx.Response(
+        200, json={"status": "RUNNING", "message": ""}
+    )
+    first, second, third = make_job_ref(), make_job_ref(), make_job_ref()
+
+    for job in (first, second, third):
+        status(job, ttl=60.0)
+
+    assert list(_status_cache) == [
+        (second.id, ScopeFilterEnum.USER),
+        (third.id, ScopeFilterEnum.USER),
+    ]
+
+
+@mock.patch("qnexus.client.jobs.get_nexus_client")
+def test_statuses_preserves_job_order(get_client: mock.MagicMock) -> None:
+    """Statuses fetched concurrently are returned in the order of the jobs."""
+    jobs = [
+        make_job_ref(),
+        make_job_ref(),
+        make_job_ref(),
+    ]
+    job_statuses = dict(
+        zip([str(job.id) for job in jobs], ["QUEUED", "RUNNING", "ERROR"])
+    )
+
+    def _get(url: str, params: dict[str, Any]) -> httpx.Response:
+        job_id = url.split("/")[3]
+        return httpx.Response(200, json={"status": job_statuses[job_id], "message": ""})
+
+    get_client.return_value.get.side_effect = _get
+
+    assert [job_status.status for job_status in statuses(jobs)] == [
+        JobStatusEnum.QUEUED,
+        JobStatusEnum.RUNNING,
+        JobStatusEnum.ERROR,
+    ]
+    assert statuses([]) == []
+
+
+@mock.patch("qnexus.client.jobs._fetch_status", side_effect=slow_status("QUEUED"))
+def test_wait_for_works_inside_a_running_event_loop(
+    fetch_status: mock.MagicMock,
+) -> None:
+    """wait_for blocks on its own event loop, so can be called from code that is
+    itself running in one (e.g. a notebook cell)."""
+    job = make_job_ref()
+
+    async def _caller() -> JobStatus:
+        return wait_for(job)
+
+    with mock.patch(
+        "qnexus.client.jobs.connect", fake_connect(FakeWebsocket(["COMPLETED"]))
+    ):
+        job_status = asyncio.run(_caller())
+
+    assert job_status.status == JobStatusEnum.COMPLETED
+
+
+@mock.patch("qnexus.client.jobs.get_nexus_client")
+def test_terminal_status_is_not_refetched(get_client: mock.MagicMock) -> None:
+    """Once a job is seen in a terminal status its ref answers status queries,
+    until the job is retried."""
+    job = make_job_ref()
+    client = get_client.return_value
+    client.get.return_value = httpx.Response(
+        200, json={"status": "ERROR", "message": "failed"}
+    )
+    client.post.return_value = httpx.Response(202)
+
+    assert status(job).status == JobStatusEnum.ERROR
+    assert job.last_status == JobStatusEnum.ERROR
+    assert job.last_message == "failed"
+
+    assert status(job).status == JobStatusEnum.ERROR
+    assert wait_for(job, wait_for_status=JobStatusEnum.ERROR).message == "failed"
+    assert client.get.call_count == 1
+
+    retry_submission(job)
+    status(job)
+    assert client.get.call_count == 2
+
+
+def test_status_websocket_url_has_no_empty_path_segments() -> None:
+    """The status websocket URL is well formed, so isn't redirected."""
+    job = make_job_ref()
+    scheme, _, rest = _status_ws_url(job).partition("://")
+
+    assert scheme in ("ws", "wss")
+    assert "//" not in rest
+    assert rest.endswith(f"/api/jobs/v1beta3/{job.id}/attributes/status/ws")
+
+
+def test_job_status_from_dict_looks_up_status_by_name() -> None:
+    """Statuses are parsed by name, and unknown ones are rejected."""
+    job_status = JobStatus.from_dict({"status": "QUEUED", "message": "waiting"})
+    assert job_status.status == JobStatusEnum.QUEUED
+    assert job_status.message == "waiting"
+
+    with pytest.raises(ValueError):
+        JobStatus.from_dict({"status": "queued", "message": ""})
+
+
+TIMESTAMPS = {"created": "2025-01-01T00:00:00Z", "modified": "2025-01-01T00:00:00Z"}
+
+
+def job_json(job_type: str, job_status: str, project_id: str) -> dict[str, Any]:
+    """The JSON record of a job in a listing."""
+    return {
+        "id": str(uuid.uuid4()),
+        "attributes": {
+            "name": f"{job_type} job",
+            "timestamps": TIMESTAMPS,
+            "job_type": job_type,
+            "status": {"status": job_status, "message": ""},
+        },
+        "relationships": {"project": {"data": {"id": project_id}}},
+    }
+
+
+def project_json(project_id: str) -> dict[str, Any]:
+    """The JSON record of a project included in a listing."""
+    return {
+        "id": project_id,
+        "type": "project",
+        "attributes": {
+            "name": "project",
+            "timestamps": TIMESTAMPS,
+            "contents_modified": "2025-01-01T00:00:00Z",
+            "archived": False,
+        },
+    }
+
+
+@mock.patch("qnexus.client.jobs.get_nexus_client")
+def test_get_all_builds_job_refs_one_at_a_time(get_client: mock.MagicMock) -> None:
+    """Listed jobs are parsed as they are iterated, so a job is available
+    before the rest of its page has been parsed."""
+    project_id = str(uuid.uuid4())
+    page = {
+        "data": [
+            job_json("compile", "COMPLETED", project_id),
+            job_json("execute", "RUNNING", project_id),
+            job_json("execute", "not a status", project_id),
+        ],
+        "included": [project_json(project_id)],
+    }
+    get_client.return_value.get.side_effect = lambda url, params: httpx.Response(
+        200, json=page if params["page[number]"] == (0,) else {"data": []}
+    )
+
+    jobs = get_all(scope=ScopeFilterEnum.USER)
+    compile_job, execute_job = next(jobs), next(jobs)
+
+    assert isinstance(compile_job, CompileJobRef)
+    assert compile_job.last_status == JobStatusEnum.COMPLETED
+    assert isinstance(execute_job, ExecuteJobRef)
+    assert execute_job.last_status == JobStatusEnum.RUNNING
+    assert execute_job.project is compile_job.project
+    assert str(compile_job.project.id) == project_id
+    with pytest.raises(ValueError):
+        next(jobs)
+
+
+@mock.patch("qnexus.client.jobs.get_nexus_client")
+def test_get_all_requires_included_systems(get_client: mock.MagicMock) -> None:
+    """A listed job's system comes from the included records, and one missing
+    from them is an error, as when fetching the job by id."""
+    project_id, system_id = str(uuid.uuid4()), str(uuid.uuid4())
+    entry = job_json("execute", "QUEUED", project_id)
+    entry["relationships"]["system"] = {"data": {"id": system_id}}
+    system = {
+        "id": system_id,
+        "type": "system",
+        "attributes": {"name": "H2-1", "provider_name": "Quantinuum"},
+    }
+    included = [project_json(project_id)]
+    get_client.return_value.get.side_effect = lambda url, params: httpx.Response(
+        200,
+        json=(
+            {"data": [entry], "included": included}
+            if params["page[number]"] == (0,)
+            else {"data": []}
+        ),
+    )
+
+    with pytest.raises(KeyError):
+        get_all().list()
+
+    included.append(system)
+    (job,) = get_all().list()
+    assert job.system is not None
+    assert str(job.system.id) == system_id
+    assert job.system.name == "H2-1"
@@ -0,0 +1,105 @@
+"""Checks for paginating through Nexus resources."""
+
+from typing import Any
+from unittest import mock
+
+import httpx
+import pytest
+
+import qnexus.exceptions as qnx_exc
+from qnexus.client.nexus_iterator import NexusIterator
+from qnexus.models.references import DataframableList
+
+
+def _page_response(url: str, params: dict[str, Any]) -> httpx.Response:
+    """Serve 3 full pages of 2 items, then a short page of 1."""
+    (page_number,) = params["page[number]"]
+    items = {0: [0, 1], 1: [2, 3], 2: [4, 5], 3: [6]}.get(page_number, [])
+    return httpx.Response(200, json={"data": items})
+
+
+def test_prefetched_pages_are_yielded_in_order() -> None:
+    """Reading pages ahead doesn't change what is iterated, and stops reading
+    ahead once a short page is seen."""
+    client = mock.MagicMock()
+    client.get.side_effect = _page_response
+
+    iterator = NexusIterator(
+        resource_type="Test",
+        nexus_url="/api/test",
+        params={"page[size]": 2},
+        wrapper_method=lambda page_json: DataframableList(page_json["data"]),
+        nexus_client=client,
+        prefetch_pages=4,
+    )
+
+    assert list(iterator) == [0, 1, 2, 3, 4, 5, 6]
+    for unused_page in iterator._prefetched:
+        unused_page.result()
+    requested_pages = sorted(
+        call.kwargs["params"]["page[number]"][0] for call in client.get.call_args_list
+    )
+    assert requested_pages == [0, 1, 2, 3, 4, 5, 6]
+    assert "page[number]" not in iterator.params
+
+
+def test_short_first_page_is_not_read_ahead() -> None:
+    """A listing that fits in one page makes no more requests than without
+    reading ahead."""
+    client = mock.MagicMock()
+    client.get.side_effect = lambda url, params: httpx.Response(
+        200, json={"data": [0, 1, 2] if params["page[number]"] == (0,) else []}
+    )
+
+    iterator = NexusIterator(
+        resource_type="Test",
+        nexus_url="/api/test",
+        params={"page[size]": 50},
+        wrapper_method=lambda page_json: DataframableList(page_json["data"]),
+        nexus_client=client,
+        prefetch_pages=4,
+    )
+
+    assert list(iterator) == [0, 1, 2]
+    assert client.get.call_count == 2
+
+    unsized_iterator = NexusIterator(
+        resource_type="Test",
+        nexus_url="/api/test",
+        params={},
+        wrapper_method=lambda page_json: DataframableList(page_json["data"]),
+        nexus_client=client,
+        prefetch_pages=4,
+    )
+    assert list(unsized_iterator) == [0, 1, 2]
+    assert client.get.call_count == 4
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 4])
+def test_failed_page_is_requested_again(prefetch_pages: int) -> None:
+    """After a page fails, continuing the iteration retries that page rather
+    than skipping to the next one."""
+    failures = {1}
+
+    def flaky_page_response(url: str, params: dict[str, Any]) -> httpx.Response:
+        (page_number,) = params["page[number]"]
+        if page_number in failures:
+            failures.discard(page_number)
+            return httpx.Response(503, text="unavailable")
+        return _page_response(url, params)
+
+    client = mock.MagicMock()
+    client.get.side_effect = flaky_page_response
+    iterator = NexusIterator(
+        resource_type="Test",
+        nexus_url="/api/test",
+        params={"page[size]": 2},
+        wrapper_method=lambda page_json: DataframableList(page_json["data"]),
+        nexus_client=client,
+        prefetch_pages=prefetch_pages,
+    )
+
+    assert [next(iterator), next(iterator)] == [0, 1]
+    with pytest.raises(qnx_exc.ResourceFetchFailed):
+        next(iterator)
+    assert list(iterator) == [2, 3, 4, 5, 6]
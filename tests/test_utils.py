@@ -1,13 +1,26 @@
 import datetime as dt
+import json
 import warnings
 from typing import Union
 from unittest import mock
 from uuid import uuid4
 
+import httpx
+import pytest
+
 from qnexus import QuantinuumConfig
 from qnexus.client.jobs._compile import start_compile_job
-from qnexus.client.utils import accept_circuits_for_programs
+from qnexus.client.utils import (
+    accept_circuits_for_programs,
+    decode_json,
+    encode_json,
+    index_included,
+    map_concurrently,
+    project_ref_resolver,
+)
+from qnexus.context import get_active_scope, using_scope
 from qnexus.models.references import CircuitRef, ProjectRef
+from qnexus.models.scope import ScopeFilterEnum
 
 PROJECT_REF = ProjectRef(
     annotations={}, id=uuid4(), contents_modified=dt.datetime.now()
@@ -56,20 +69,21 @@ def test_compile_circuit_with_wrapper() -> None:
     with mock.patch("qnexus.client.jobs._compile.get_nexus_client") as gnc:
         mock_client = mock.MagicMock()
 
-        mock_resp = mock.MagicMock()
-        mock_resp.status_code = 202
-        mock_resp.json.return_value = {
-            "data": {
-                "id": str(uuid4()),
-                "attributes": {
-                    "name": "blah",
-                    "timestamps": {
-                        "created": dt.datetime.now(),
-                        "modified": dt.datetime.now(),
+        mock_resp = httpx.Response(
+            202,
+            json={
+                "data": {
+                    "id": str(uuid4()),
+                    "attributes": {
+                        "name": "blah",
+                        "timestamps": {
+                            "created": dt.datetime.now().isoformat(),
+                            "modified": dt.datetime.now().isoformat(),
+                        },
                     },
-                },
-            }
-        }
+                }
+            },
+        )
 
         mock_client.post.return_value = mock_resp
         gnc.return_value = mock_client
@@ -88,7 +102,71 @@ def test_compile_circuit_with_wrapper() -> None:
         assert mock_client.post.call_count == 1
         assert (
             "program_id"
-            in mock_client.post.call_args[1]["json"]["data"]["attributes"][
-                "definition"
-            ]["items"][0]
+            in json.loads(mock_client.post.call_args[1]["content"])["data"][
+                "attributes"
+            ]["definition"]["items"][0]
         )
+
+
+def test_json_helpers_match_stdlib() -> None:
+    """The pydantic-core JSON helpers agree with the stdlib encoding used by httpx."""
+    body = {"data": {"id": "abc", "attributes": {"n": [1, 2.5, None, True, "é"]}}}
+
+    assert json.loads(encode_json(body)) == body
+    assert decode_json(httpx.Response(200, json=body)) == body
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_encode_json_rejects_non_finite_floats(value: float) -> None:
+    """Non-finite floats raise as they would through httpx, rather than being
+    sent as invalid JSON."""
+    with pytest.raises(ValueError):
+        encode_json({"data": {"attributes": {"n": [1.0, value]}}})
+
+    assert json.loads(encode_json({"name": "NaN Infinity"})) == {"name": "NaN Infinity"}
+
+
+def test_map_concurrently_keeps_order_and_context() -> None:
+    """Concurrent calls return in item order and see the caller's scope."""
+    with using_scope(ScopeFilterEnum.HIGHEST):
+        results = map_concurrently(
+            lambda n: (n * n, get_active_scope()), range(20), max_workers=4
+        )
+
+    assert results == [(n * n, ScopeFilterEnum.HIGHEST) for n in range(20)]
+    assert map_concurrently(str, [], max_workers=4) == []
+
+
+def test_project_ref_resolver_shares_refs_within_a_project() -> None:
+    """Resources in the same included project get the same ProjectRef."""
+    project_ids = [str(uuid4()), str(uuid4())]
+    included = [
+        {
+            "id": project_id,
+            "type": "project",
+            "attributes": {
+                "name": f"project {n}",
+                "description": None,
+                "properties": {},
+                "timestamps": {
+                    "created": "2025-01-01T00:00:00Z",
+                    "modified": "2025-01-01T00:00:00Z",
+                },
+                "contents_modified": "2025-01-01T00:00:00Z",
+                "archived": False,
+            },
+        }
+        for n, project_id in enumerate(project_ids)
+    ]
+    resources = [
+        {"relationships": {"project": {"data": {"id": project_id}}}}
+        for project_id in (project_ids[0], project_ids[1], project_ids[0])
+    ]
+
+    project_of = project_ref_resolver(index_included(included))
+    first, second, third = (project_of(resource) for resource in resources)
+
+    assert str(first.id) == project_ids[0]
+    assert first.annotations.name == "project 0"
+    assert str(second.id) == project_ids[1]
+    assert third is first